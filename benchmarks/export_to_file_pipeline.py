@@ -0,0 +1,58 @@
+"""
+Benchmark export_to_file with and without pipelined stages.
+
+Exports a document of spheres, whose curved faces make for large meshes
+and files, to a temporary file, reporting the median time of each mode
+and the speedup of pipelining over exporting sequentially.
+
+Usage:
+
+    python benchmarks/export_to_file_pipeline.py [objects] [repetitions]
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import FreeCAD as App
+from FreeCAD import Placement, Rotation, Vector
+
+from freecad_to_obj import export_to_file
+
+
+def make_document(count: int) -> list:
+    document = App.newDocument()
+    objects = []
+    for i in range(count):
+        sphere = document.addObject('Part::Sphere', f'Sphere{i}')
+        sphere.Placement = Placement(Vector(25 * i, 0, 0), Rotation())
+        objects.append(sphere)
+    document.recompute()
+    return objects
+
+
+def measure(objects: list, pipelined: bool, repetitions: int) -> float:
+    timings = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'spheres.obj')
+        for _ in range(repetitions):
+            start = time.perf_counter()
+            export_to_file(objects, path, pipelined=pipelined)
+            timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main(count: int, repetitions: int) -> None:
+    objects = make_document(count)
+    sequential = measure(objects, False, repetitions)
+    pipelined = measure(objects, True, repetitions)
+    print(f'{"mode":<12}{"median s":>10}')
+    print(f'{"sequential":<12}{sequential:>10.3f}')
+    print(f'{"pipelined":<12}{pipelined:>10.3f}')
+    print(f'speedup: {sequential / pipelined:.2f}x')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 5)
@@ -0,0 +1,38 @@
+"""
+Benchmark the time to import freecad_to_obj in a fresh interpreter.
+
+FreeCAD itself is imported before timing starts,
+so only the cost of this package and what it pulls in is measured.
+
+Usage:
+
+    python benchmarks/import_time.py [repetitions]
+"""
+import statistics
+import subprocess
+import sys
+
+SCRIPT = '''
+import time
+import FreeCAD
+start = time.perf_counter()
+import freecad_to_obj
+print(time.perf_counter() - start)
+'''
+
+
+def measure_import_time() -> float:
+    output = subprocess.check_output([sys.executable, '-c', SCRIPT])
+    return float(output.decode().strip().splitlines()[-1])
+
+
+def main(repetitions: int) -> None:
+    timings = [measure_import_time() for _ in range(repetitions)]
+    print(f'import freecad_to_obj over {repetitions} runs:')
+    print(f'  median: {statistics.median(timings) * 1000:.1f} ms')
+    print(f'  min:    {min(timings) * 1000:.1f} ms')
+    print(f'  max:    {max(timings) * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
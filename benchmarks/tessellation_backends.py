@@ -0,0 +1,60 @@
+"""
+Benchmark each tessellation backend on a fixed corpus of shapes.
+
+Reports the median time, triangles, and vertices of each backend per shape,
+to inform which backend to choose for which kind of shape.
+Backends unavailable in this FreeCAD build are reported as such.
+
+Usage:
+
+    python benchmarks/tessellation_backends.py [repetitions]
+"""
+import statistics
+import sys
+import time
+
+import FreeCAD as App
+import Part
+
+from freecad_to_obj.export import TESSELLATION_BACKENDS, default_mesh_settings
+
+
+def make_corpus() -> dict:
+    box = Part.makeBox(10, 10, 10)
+    cylinder = Part.makeCylinder(5, 20)
+    sphere = Part.makeSphere(10)
+    return {
+        'box': box,
+        'cylinder': cylinder,
+        'sphere': sphere,
+        'torus': Part.makeTorus(10, 2),
+        'cone': Part.makeCone(5, 2, 10),
+        'box minus cylinder': box.cut(Part.makeCylinder(3, 10, App.Vector(5, 5, 0))),
+        'sphere fused with box': sphere.fuse(box)
+    }
+
+
+def measure(backend, shape, repetitions: int) -> tuple:
+    timings = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        (points, normals, triangles), face_triangles = backend(
+            shape, default_mesh_settings)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), len(triangles), len(points)
+
+
+def main(repetitions: int) -> None:
+    print(f'{"shape":<24}{"backend":<12}{"median ms":>10}{"triangles":>11}{"vertices":>10}')
+    for shape_name, shape in make_corpus().items():
+        for backend_name, backend in TESSELLATION_BACKENDS.items():
+            try:
+                seconds, triangles, vertices = measure(backend, shape, repetitions)
+            except Exception as exception:
+                print(f'{shape_name:<24}{backend_name:<12}  unavailable: {exception}')
+                continue
+            print(f'{shape_name:<24}{backend_name:<12}{seconds * 1000:>10.2f}{triangles:>11}{vertices:>10}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
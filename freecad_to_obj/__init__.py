@@ -1,3 +1,25 @@
-__all__ = ['export']
+__all__ = [
+    'compile_filter',
+    'estimate',
+    'export',
+    'export_arrays',
+    'export_batches',
+    'export_chunks',
+    'export_delta',
+    'export_shards',
+    'export_tiles',
+    'export_to_file',
+    'merge'
+]
 
+from .estimate import estimate
 from .export import export
+from .export_arrays import export_arrays
+from .export_batches import export_batches
+from .export_chunks import export_chunks
+from .export_delta import export_delta
+from .export_shards import export_shards
+from .export_tiles import export_tiles
+from .export_to_file import export_to_file
+from .filters import compile_filter
+from .merge import merge
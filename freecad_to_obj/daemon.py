@@ -0,0 +1,163 @@
+"""
+Long-lived export worker which keeps FreeCAD and recently opened documents loaded.
+
+Reads one JSON job per line from standard input,
+and writes one JSON result per line to standard output.
+
+A job names a document, and optionally objects in it and options for export:
+
+    {"id": 1, "path": "/models/Cube.FCStd", "objects": ["Box"], "options": {"preview": true}}
+
+Objects are given by Name, and default to the root objects of the document.
+Options are keyword arguments of export which can be expressed in JSON,
+with keep_unresolved and do_not_export given as filter specifications.
+
+A result carries the id of its job along with either .obj file contents or an error:
+
+    {"id": 1, "obj": "o Cube\\n..."}
+    {"id": 1, "error": "No object named Box in /models/Cube.FCStd."}
+
+Usage:
+
+    python -m freecad_to_obj.daemon [--cache-size N]
+"""
+import argparse
+import json
+import os
+import sys
+from collections import Counter, OrderedDict
+from typing import List, Optional, Set, TextIO, Tuple
+
+import FreeCAD as App
+
+from .export import export
+
+__all__ = ['DocumentCache', 'serve']
+
+
+class DocumentCache:
+    """
+    Least recently used cache of opened and recomputed documents, keyed by path,
+    so a document is reopened once its file or the file of a document it links to changes.
+
+    Documents loaded through links are reference counted,
+    and closed once no cached document depends on them.
+    Before any document is returned or opened, cached documents depending
+    on a changed file are closed, so FreeCAD never reuses a stale document
+    it still has open when loading links.
+    """
+
+    def __init__(self, size: int = 8):
+        self.size = size
+        self.documents: 'OrderedDict[str, Tuple[object, List[Tuple[str, Optional[float]]]]]' = OrderedDict()
+        self.references: Counter = Counter()
+
+    def get(self, path: str) -> object:
+        path = os.path.abspath(path)
+        self._evict_stale()
+        if path in self.documents:
+            self.documents.move_to_end(path)
+            return self.documents[path][0]
+        document = App.openDocument(path)
+        document.recompute()
+        stamp = _get_stamp(document)
+        self.documents[path] = (document, stamp)
+        self.references.update(name for name, _ in stamp)
+        while len(self.documents) > self.size:
+            self._evict(next(iter(self.documents)))
+        return document
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def _evict_stale(self) -> None:
+        """
+        Evict every cached document depending on a changed document,
+        which closes the changed document once nothing depends on it.
+        """
+        changed = set()
+        for _, stamp in self.documents.values():
+            changed |= _get_changed_documents(stamp)
+        if not changed:
+            return
+        for stale_path, (_, stamp) in list(self.documents.items()):
+            if any(name in changed for name, _ in stamp):
+                self._evict(stale_path)
+
+    def _evict(self, path: str) -> None:
+        _, stamp = self.documents.pop(path)
+        for name, _ in stamp:
+            self.references[name] -= 1
+            if not self.references[name]:
+                del self.references[name]
+                App.closeDocument(name)
+
+
+def _get_stamp(document: object) -> List[Tuple[str, Optional[float]]]:
+    """
+    Name and modification time of document followed by those of the documents it links to.
+    """
+    dependencies = [d for d in document.getDependentDocuments() if d.Name != document.Name]
+    return [(d.Name, _get_mtime(d.FileName)) for d in [document] + dependencies]
+
+
+def _get_changed_documents(stamp: List[Tuple[str, Optional[float]]]) -> Set[str]:
+    documents = App.listDocuments()
+    return {
+        name for name, mtime in stamp
+        if name not in documents or _get_mtime(documents[name].FileName) != mtime
+    }
+
+
+def _get_mtime(path: str) -> Optional[float]:
+    return os.path.getmtime(path) if path and os.path.exists(path) else None
+
+
+def serve(input_stream: TextIO, output_stream: TextIO, cache: DocumentCache) -> None:
+    """
+    Handle jobs read from input_stream until it is exhausted,
+    writing a result for each to output_stream.
+    """
+    for line in input_stream:
+        if not line.strip():
+            continue
+        job_id = None
+        try:
+            job = json.loads(line)
+            job_id = job.get('id')
+            result = {'id': job_id, 'obj': _handle_job(job, cache)}
+        except Exception as exception:
+            result = {'id': job_id, 'error': str(exception)}
+        output_stream.write(json.dumps(result) + '\n')
+        output_stream.flush()
+
+
+def _handle_job(job: dict, cache: DocumentCache) -> str:
+    path = job['path']
+    document = cache.get(path)
+    if 'objects' in job:
+        objects = []
+        for name in job['objects']:
+            obj = document.getObject(name)
+            if obj is None:
+                raise ValueError(f'No object named {name} in {path}.')
+            objects.append(obj)
+    else:
+        objects = document.RootObjects
+    return export(objects, **job.get('options', {}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Export FreeCAD documents to Wavefront .obj from JSON jobs on standard input.')
+    parser.add_argument('--cache-size', type=int, default=8,
+                        help='number of documents to keep open (default: 8)')
+    args = parser.parse_args()
+    output_stream = sys.stdout
+    # Keep anything printed while exporting out of the results.
+    sys.stdout = sys.stderr
+    serve(sys.stdin, output_stream, DocumentCache(args.cache_size))
+
+
+if __name__ == '__main__':
+    main()
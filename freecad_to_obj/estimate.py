@@ -0,0 +1,191 @@
+"""
+Module to estimate the cost of an export without tessellating anything.
+
+Estimates are derived from cheap queries of each shape's
+boundary representation, such as its faces, edges, and their curvature.
+They are meant for routing and rejecting export jobs,
+and are expected to be within a small factor of the actual cost.
+"""
+from math import acos, ceil, pi, sqrt
+from typing import Callable, List, Union
+
+import Part
+
+from .export import (default_mesh_settings, default_wire_deflection,
+                     is_link_array)
+from .filters import compile_filter
+from .resolve_objects import resolve_objects
+
+__all__ = ['estimate']
+
+# Rough costs per unit of output.
+# Calibrate these against exports on the machines jobs are routed to.
+default_cost_model = {
+    'BytesPerVertex': 30,
+    'BytesPerNormal': 45,
+    'BytesPerFace': 30,
+    'BytesPerWirePoint': 36,
+    'BytesPerWire': 32,
+    'SecondsPerTriangle': 1e-5,
+    'SecondsPerWirePoint': 5e-6,
+    'SecondsPerFace': 1e-4
+}
+
+
+def estimate(export_list: List[object],
+             object_name_getter: Callable[[
+                 object, List[object], int], str] = lambda obj, path, shape_index: obj.Label,
+             keep_unresolved: Union[Callable[[object, List[object]], bool], dict] = None,
+             do_not_export: Union[Callable[[
+                 object, List[object]], bool], dict] = lambda obj, path: not obj.Visibility,
+             export_link_array_elements: bool = False,
+             mesh_settings: dict = default_mesh_settings,
+             cost_model: dict = default_cost_model) -> dict:
+    """
+    Estimate the cost of exporting a list of objects.
+
+    Takes the same arguments as export, with the addition of a cost model.
+
+    Returns a dictionary with the estimated total triangles,
+    wire_points, bytes, and seconds of the export,
+    and a list of objects with the same estimates for each shape,
+    along with its name, object, and path.
+    """
+    if isinstance(keep_unresolved, dict):
+        keep_unresolved = compile_filter(keep_unresolved)
+    if isinstance(do_not_export, dict):
+        do_not_export = compile_filter(do_not_export)
+
+    objects = []
+    for resolved_object in resolve_objects(export_list, keep_unresolved, do_not_export):
+        obj = resolved_object['object']
+        path = resolved_object['path']
+        if is_link_array(obj) and export_link_array_elements:
+            shapes = obj.Shape.SubShapes
+        else:
+            shapes = [obj.Shape]
+        for shape_index, shape in enumerate(shapes):
+            shape_estimate = estimate_shape(shape, mesh_settings, cost_model)
+            shape_estimate['name'] = object_name_getter(obj, path, shape_index)
+            shape_estimate['object'] = obj
+            shape_estimate['path'] = path
+            objects.append(shape_estimate)
+
+    totals = {
+        key: sum(o[key] for o in objects)
+        for key in ['triangles', 'wire_points', 'bytes', 'seconds']
+    }
+    return {**totals, 'objects': objects}
+
+
+def estimate_shape(shape,
+                   mesh_settings: dict = default_mesh_settings,
+                   cost_model: dict = default_cost_model) -> dict:
+    """
+    Estimate the triangles, wire_points, bytes, and seconds
+    of exporting a single shape.
+    """
+    linear_deflection = mesh_settings.get('LinearDeflection', 0.1)
+    angular_deflection = mesh_settings.get('AngularDeflection', 0.5)
+    relative = mesh_settings.get('Relative', False)
+
+    triangles = 0
+    wire_points = 0
+    wire_count = 0
+    for face in shape.Faces:
+        deflection = linear_deflection
+        if relative:
+            deflection *= face.BoundBox.DiagonalLength
+        triangles += _estimate_face_triangles(
+            face, deflection, angular_deflection)
+        for wire in face.Wires:
+            wire_count += 1
+            # Discretized wires are closed, repeating their first point.
+            wire_points += 1 + sum(
+                _estimate_edge_segments(edge, default_wire_deflection)
+                for edge in wire.Edges)
+    if not shape.Faces:
+        # Shapes without faces are exported as chains of connected edges.
+        for edges in Part.sortEdges(shape.Edges):
+            wire_count += 1
+            wire_points += 1 + sum(
+                _estimate_edge_segments(edge, default_wire_deflection)
+                for edge in edges)
+
+    # A closed triangle mesh has about half as many vertexes as triangles.
+    vertices = triangles // 2 + 2 if triangles else 0
+    size = (
+        vertices * cost_model['BytesPerVertex'] +
+        triangles * (cost_model['BytesPerNormal'] + cost_model['BytesPerFace']) +
+        wire_points * cost_model['BytesPerWirePoint'] +
+        wire_count * cost_model['BytesPerWire']
+    )
+    seconds = (
+        triangles * cost_model['SecondsPerTriangle'] +
+        wire_points * cost_model['SecondsPerWirePoint'] +
+        len(shape.Faces) * cost_model['SecondsPerFace']
+    )
+    return {
+        'triangles': triangles,
+        'wire_points': wire_points,
+        'bytes': size,
+        'seconds': seconds
+    }
+
+
+def _estimate_face_triangles(face, deflection: float, angular_deflection: float) -> int:
+    surface = face.Surface
+    umin, umax, vmin, vmax = face.ParameterRange
+    if isinstance(surface, Part.Plane):
+        # A polygon with n sides is split into n - 2 triangles,
+        # plus two triangles to bridge each hole.
+        segments = sum(
+            _estimate_edge_segments(edge, deflection, angular_deflection)
+            for edge in face.Edges)
+        return max(1, segments - 2 + 2 * (len(face.Wires) - 1))
+    if isinstance(surface, (Part.Cylinder, Part.Cone)):
+        step = _get_angular_step(surface.Radius, deflection, angular_deflection)
+        return 2 * _count_steps(umax - umin, step)
+    if isinstance(surface, Part.Sphere):
+        step = _get_angular_step(surface.Radius, deflection, angular_deflection)
+        return 2 * _count_steps(umax - umin, step) * _count_steps(vmax - vmin, step)
+    if isinstance(surface, Part.Toroid):
+        major_step = _get_angular_step(
+            surface.MajorRadius + surface.MinorRadius, deflection, angular_deflection)
+        minor_step = _get_angular_step(
+            surface.MinorRadius, deflection, angular_deflection)
+        return 2 * _count_steps(umax - umin, major_step) * _count_steps(vmax - vmin, minor_step)
+    # For other surfaces, assume curvature on the scale of the face,
+    # and triangles with sides as long as a chord within the deflection.
+    radius = face.BoundBox.DiagonalLength / 2
+    side = sqrt(8 * deflection * radius) if radius > 0 else 1
+    return max(2, ceil(face.Area / (sqrt(3) / 4 * side ** 2)))
+
+
+def _estimate_edge_segments(edge,
+                            deflection: float,
+                            angular_deflection: float = pi) -> int:
+    curve = edge.Curve
+    if isinstance(curve, Part.Line):
+        return 1
+    if isinstance(curve, Part.Circle):
+        step = _get_angular_step(curve.Radius, deflection, angular_deflection)
+        return _count_steps(edge.LastParameter - edge.FirstParameter, step)
+    radius = edge.BoundBox.DiagonalLength / 2
+    if radius <= 0:
+        return 1
+    return max(1, ceil(edge.Length / sqrt(8 * deflection * radius)))
+
+
+def _get_angular_step(radius: float, deflection: float, angular_deflection: float) -> float:
+    """
+    Largest angle whose chord stays within deflection of a circle
+    of the given radius, limited by angular_deflection.
+    """
+    if radius <= deflection:
+        return angular_deflection
+    return min(angular_deflection, 2 * acos(1 - deflection / radius))
+
+
+def _count_steps(span: float, step: float) -> int:
+    return max(1, ceil(abs(span) / step))
@@ -21,14 +21,19 @@ Modifications:
     * See: https://wiki.freecadweb.org/Mesh_Feature
 """
 
-from typing import Callable, List, Tuple
+from itertools import islice
+from math import pi
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
 
-import Draft
-import MeshPart
+import FreeCAD as App
 import Part
-from FreeCAD import Placement
+from FreeCAD import Placement, Vector
 
+from .filters import compile_filter
+from .instancing import InstanceCache, get_signature
+from .occlusion import get_enclosed_indices
 from .resolve_objects import resolve_objects
+from .simplify import simplify_polyline
 
 __all__ = ['export']
 
@@ -39,96 +44,977 @@ default_mesh_settings = {
     'Relative': True
 }
 
+default_wire_deflection = 0.005
+
+# Factors by which mesh and wire deflections are multiplied
+# on successive tessellation attempts when a timeout is given.
+coarsening_factors = [1, 4, 16]
+
+# Ways of deriving wires:
+#   * discretize: discretize the wires of each face separately.
+#   * triangulation: trace the boundary of the triangles of each face,
+#     so wires share the vertexes of the mesh.
+WIRE_MODES = ['discretize', 'triangulation']
+
+
 def export(export_list: List[object],
            object_name_getter: Callable[[
                object, List[object], int], str] = lambda obj, path, shape_index: obj.Label,
-           keep_unresolved: Callable[[object, List[object]], bool] = None,
-           do_not_export: Callable[[
-               object, List[object]], bool] = lambda obj, path: not obj.Visibility,
+           keep_unresolved: Union[Callable[[object, List[object]], bool], dict] = None,
+           do_not_export: Union[Callable[[
+               object, List[object]], bool], dict] = lambda obj, path: not obj.Visibility,
            export_link_array_elements: bool = False,
-           mesh_settings: dict = default_mesh_settings) -> str:
+           mesh_settings: dict = default_mesh_settings,
+           preview: bool = False,
+           tessellation_timeout: float = None,
+           copy_shapes: bool = True,
+           instance_congruent_shapes: bool = False,
+           wire_mode: str = 'discretize',
+           tessellation_backend: Union[str, Callable[[
+               object, List[object], int], str]] = 'standard',
+           cull_occluded: bool = False,
+           refine: bool = False,
+           resolved_slice: slice = None,
+           wire_simplification: dict = None,
+           merge_wires: bool = False,
+           reuse_triangulation: bool = False,
+           offsetv: int = 1,
+           offsetvn: int = 1,
+           return_offsets: bool = False) -> Union[str, Tuple[str, int, int]]:
     """
     Transforms a list of objects into a Wavefront .obj file contents.
+
+    keep_unresolved and do_not_export may be given as filter
+    specifications instead of functions, see compile_filter.
+
+    In preview mode each shape is replaced by its oriented bounding box,
+    and wires are omitted, which skips tessellation entirely.
+
+    When a tessellation timeout in seconds is given, each shape is
+    tessellated in a separate process which is killed after the timeout.
+    Tessellation is then retried with coarser settings,
+    and finally replaced by a bounding box, so each shape may take
+    up to one timeout per coarsening factor. Worker processes are forked,
+    so timeouts are only supported on POSIX platforms such as Linux and macOS.
+    Such fallbacks are reported as comments preceding the object.
+
+    Without copying shapes, each shape is tessellated in place,
+    and the resulting vertices, normals, and wires are transformed
+    by the resolved placement instead.
+
+    When instancing congruent shapes, shapes which are copies of each other,
+    such as duplicated bodies, are tessellated once, and the tessellation
+    is moved into place for each copy. See the instancing module.
+
+    Wires are discretized from each face by default. With a wire_mode of
+    'triangulation', wires instead trace the boundary of the triangles
+    of each face, sharing the vertexes of the mesh.
+
+    Shapes are triangulated by the Standard mesher of MeshPart by default.
+    Another backend from TESSELLATION_BACKENDS may be named,
+    or chosen for each shape by a function taking the same arguments
+    as object_name_getter. mesh_settings may be keyed by backend name,
+    such as {'netgen': {'Fineness': 3}, 'tessellate': {'LinearDeflection': 0.5}},
+    giving each backend its own settings.
+
+    When culling occluded shapes, shapes enclosed by a closed solid
+    of another shape, such as components inside a housing,
+    are skipped before tessellation. See the occlusion module.
+
+    When refining, coplanar and other faces split by boolean operations
+    are merged before tessellation, removing their seams.
+    Each object's shapes are refined once, however many times it is resolved.
+
+    To split an export across processes, each may export a resolved_slice
+    of the resolved objects. When culling occluded shapes, every object
+    is still resolved, so shapes are culled by those outside the slice.
+    Vertexes and vertex normals are numbered from offsetv and offsetvn,
+    and the offsets following the last object are
+    returned along with the contents when return_offsets is True.
+    Contents exported with offsets continuing from each other may be
+    concatenated, and contents numbered from 1 may be combined with merge.
+
+    Wires are simplified when given wire_simplification settings,
+    dropping points within a Tolerance of the simplified wire,
+    which is relative to the size of each shape if Relative is True.
+    See the simplify module.
+
+    Each wire is written as its own object named after the shape and the
+    index of the wire, such as CubeWire0. When merging wires, all wires of
+    a shape are written as one object, such as CubeWire, with a line for each.
+
+    When reusing triangulations, shapes keep any triangulation they carry,
+    such as one saved by the GUI. Only the tessellate backend reuses them,
+    keeping the triangulation of each face that is at least as fine as
+    the LinearDeflection of mesh_settings, and meshing the rest,
+    so reusing triangulations requires naming it as tessellation_backend.
     """
-    lines = []
+    records = get_records(export_list,
+                          object_name_getter=object_name_getter,
+                          keep_unresolved=keep_unresolved,
+                          do_not_export=do_not_export,
+                          export_link_array_elements=export_link_array_elements,
+                          mesh_settings=mesh_settings,
+                          preview=preview,
+                          tessellation_timeout=tessellation_timeout,
+                          copy_shapes=copy_shapes,
+                          instance_congruent_shapes=instance_congruent_shapes,
+                          wire_mode=wire_mode,
+                          tessellation_backend=tessellation_backend,
+                          cull_occluded=cull_occluded,
+                          refine=refine,
+                          resolved_slice=resolved_slice,
+                          wire_simplification=wire_simplification,
+                          merge_wires=merge_wires,
+                          reuse_triangulation=reuse_triangulation)
+    lines, offsetv, offsetvn = format_records(records, offsetv, offsetvn)
+    if return_offsets:
+        return join_lines(lines), offsetv, offsetvn
+    return join_lines(lines)
+
+
+def get_records(export_list: List[object],
+                object_name_getter: Callable[[
+                    object, List[object], int], str] = lambda obj, path, shape_index: obj.Label,
+                keep_unresolved: Union[Callable[[object, List[object]], bool], dict] = None,
+                do_not_export: Union[Callable[[
+                    object, List[object]], bool], dict] = lambda obj, path: not obj.Visibility,
+                export_link_array_elements: bool = False,
+                mesh_settings: dict = default_mesh_settings,
+                preview: bool = False,
+                tessellation_timeout: float = None,
+                copy_shapes: bool = True,
+                instance_congruent_shapes: bool = False,
+                wire_mode: str = 'discretize',
+                tessellation_backend: Union[str, Callable[[
+                    object, List[object], int], str]] = 'standard',
+                cull_occluded: bool = False,
+                refine: bool = False,
+                resolved_slice: slice = None,
+                wire_simplification: dict = None,
+                merge_wires: bool = False,
+                reuse_triangulation: bool = False,
+                local_frame: bool = False,
+                shape_filter: Callable[[dict], bool] = None,
+                resolve_stage: Callable[[Iterable], Iterable] = None) -> Iterator[dict]:
+    """
+    Resolve and tessellate a list of objects,
+    yielding a record for each shape to export.
+
+    Takes the same keyword arguments as export, along with a shape_filter
+    deciding whether to tessellate a shape. It is given a dictionary with
+    the name, object, path, shape_index, shape, and transform of the shape,
+    where transform is a placement to move the shape by, or None.
 
-    # Vertex numbers start from 1 instead of 0
-    offsetv = 1
-    offsetvn = 1
+    In a local_frame, each shape is tessellated at an identity placement,
+    and its placement is given by the shape_placement of its record.
+
+    A resolve_stage, such as one running it in a thread of its own,
+    is given the iterator of resolved objects and their shapes,
+    and returns the iterator to tessellate them from.
+
+    Each record is a dictionary with the following keys:
+
+        * name: name of the object in the export.
+        * object: resolved object.
+        * path: parents of the resolved object.
+        * placement: resolved placement.
+        * shape_index: index of the shape within the resolved object.
+        * mesh: points, facet normals, and zero-based triangle indices.
+        * wires: list of wires, each a list of points.
+        * wire_indices: list of wires, each a list of zero-based indices
+          into the points of the mesh, or None if wires are discretized.
+        * comment: description of a tessellation fallback, or None.
+        * merge_wires: whether to write all wires as one object.
+        * shape_placement: placement of the mesh and wires in a local_frame,
+          or None if they are in place.
+    """
+    _check_options(wire_mode, tessellation_backend, reuse_triangulation, tessellation_timeout)
+    if isinstance(keep_unresolved, dict):
+        keep_unresolved = compile_filter(keep_unresolved)
+    if isinstance(do_not_export, dict):
+        do_not_export = compile_filter(do_not_export)
+
+    settings = {
+        'mesh_settings': mesh_settings,
+        'wire_deflection': default_wire_deflection,
+        'wire_mode': wire_mode,
+        'wire_simplification': wire_simplification
+    }
+    instance_cache = InstanceCache() if instance_congruent_shapes else None
 
     resolved_objects = resolve_objects(
         export_list, keep_unresolved, do_not_export)
-    for resolved_object in resolved_objects:
+    object_shapes = _get_object_shapes(
+        resolved_objects, resolved_slice, copy_shapes, export_link_array_elements,
+        cull_occluded, refine, reuse_triangulation)
+    if resolve_stage is not None:
+        object_shapes = resolve_stage(object_shapes)
+    for resolved_object, shapes in object_shapes:
         obj = resolved_object['object']
         placement = resolved_object['placement']
         path = resolved_object['path']
-        shapes = get_shapes(obj, placement, export_link_array_elements)
-        for shape_index, shape in enumerate(shapes):
-            vlist, vnlist, flist = _get_indices(shape, offsetv, offsetvn, mesh_settings)
-
-            offsetv += len(vlist)
-            offsetvn += len(vnlist)
-            object_name = object_name_getter(obj, path, shape_index)
-            if type(object_name) != str:
-                raise ValueError('object_name_getter must return string.')
-            lines.append('o ' + object_name)
-
-            for v in vlist:
-                lines.append('v ' + v)
-            for vn in vnlist:
-                lines.append('vn ' + vn)
-            for f in flist:
-                lines.append('f ' + f)
-
-            wires = get_wires(shape)
-
-            for i, wire in enumerate(wires):
-                # TODO: Consider passing in wire_label_delimiter argument.
+        for shape_index, shape, transform in shapes:
+            object_name = _get_object_name(object_name_getter, obj, path, shape_index)
+            if shape_filter is not None and not shape_filter({
+                'name': object_name,
+                'object': obj,
+                'path': path,
+                'shape_index': shape_index,
+                'shape': shape,
+                'transform': transform
+            }):
+                continue
+            shape_placement = None
+            if local_frame:
+                shape, shape_placement = _get_local_shape(shape, transform)
+                transform = None
+            settings['backend'], settings['mesh_settings'] = _get_backend(
+                tessellation_backend, mesh_settings, obj, path, shape_index)
+            tessellation, failure = _tessellate_shape(
+                shape, transform, settings, preview, tessellation_timeout, instance_cache)
+            yield {
+                'name': object_name,
+                'object': obj,
+                'path': path,
+                'placement': placement,
+                'shape_index': shape_index,
+                **tessellation,
+                'comment': failure,
+                'merge_wires': merge_wires,
+                'shape_placement': shape_placement
+            }
+
+
+def format_records(records: Iterable[dict],
+                   offsetv: int,
+                   offsetvn: int) -> Tuple[List[str], int, int]:
+    """
+    Format records from get_records into lines of a Wavefront .obj file,
+    numbering vertexes and vertex normals from the given offsets.
+
+    Returns the lines, and the offsets following the last record.
+    """
+    lines = []
+    for record in records:
+        record_lines, offsetv, offsetvn = format_record(
+            record, offsetv, offsetvn)
+        lines.extend(record_lines)
+    return lines, offsetv, offsetvn
+
+
+def format_record(record: dict,
+                  offsetv: int,
+                  offsetvn: int,
+                  precision: int = None) -> Tuple[List[str], int, int]:
+    """
+    Format a single record from get_records, see format_records.
+
+    Vertexes are rounded to precision decimals,
+    defaulting to the precision set in Draft preferences.
+    """
+    lines = []
+    object_name = record['name']
+    if record['comment']:
+        lines.append(f'# {object_name}: {record["comment"]}')
+
+    mesh_offsetv = offsetv
+    vlist, vnlist, flist = _format_indices(
+        *record['mesh'], offsetv, offsetvn, precision)
+
+    offsetv += len(vlist)
+    offsetvn += len(vnlist)
+    lines.append('o ' + object_name)
+
+    for v in vlist:
+        lines.append('v ' + v)
+    for vn in vnlist:
+        lines.append('vn ' + vn)
+    for f in flist:
+        lines.append('f ' + f)
+
+    wire_lines, offsetv = _format_wires(record, offsetv, mesh_offsetv)
+    lines.extend(wire_lines)
+    return lines, offsetv, offsetvn
+
+
+def _format_wires(record: dict, offsetv: int, mesh_offsetv: int) -> Tuple[List[str], int]:
+    """
+    Format the wires of a record, numbering any vertexes of their own from offsetv.
+
+    Returns the lines, and the vertex offset following the wires.
+    """
+    lines = []
+    object_name = record['name']
+    merge_wires = record.get('merge_wires', False)
+    if merge_wires and record['wires']:
+        lines.append(f'o {object_name}Wire')
+
+    if record['wire_indices'] is not None:
+        # Wires share the vertexes of the mesh.
+        for i, wire in enumerate(record['wire_indices']):
+            if not merge_wires:
                 lines.append(f'o {object_name}Wire{i}')
-                line_segments = []
-                for vertex in wire:
-                    x, y, z = vertex
-                    lines.append(f'v {x} {y} {z}')
-                    line_segments.append(str(offsetv))
-                    offsetv += 1
-                lines.append('l ' + ' '.join(line_segments))
+            lines.append('l ' + ' '.join(str(index + mesh_offsetv) for index in wire))
+        return lines, offsetv
+
+    for i, wire in enumerate(record['wires']):
+        # TODO: Consider passing in wire_label_delimiter argument.
+        if not merge_wires:
+            lines.append(f'o {object_name}Wire{i}')
+        line_segments = []
+        for vertex in wire:
+            x, y, z = format_wire_vertex(vertex)
+            lines.append(f'v {x} {y} {z}')
+            line_segments.append(str(offsetv))
+            offsetv += 1
+        lines.append('l ' + ' '.join(line_segments))
+    return lines, offsetv
+
+
+def get_record_bounds(record: dict) -> Optional[List[float]]:
+    """
+    Return the bounds of a record's mesh and wires
+    as [xmin, ymin, zmin, xmax, ymax, zmax], or None if it has no points.
+    """
+    points = list(record['mesh'][0])
+    for wire in record['wires']:
+        points.extend(wire)
+    if not points:
+        return None
+    xs, ys, zs = zip(*((p[0], p[1], p[2]) for p in points))
+    return [min(xs), min(ys), min(zs), max(xs), max(ys), max(zs)]
+
+
+def join_lines(lines: List[str]) -> str:
     if len(lines) == 0:
         return ''
     return '\n'.join(lines) + '\n'
 
 
-def _get_indices(
-        shape,
-        offsetv: int,
-        offsetvn: int,
-        mesh_settings: dict) -> Tuple[List[str], List[str], List[str]]:
+def _check_options(wire_mode: str,
+                   tessellation_backend: Union[str, Callable[[object, List[object], int], str]],
+                   reuse_triangulation: bool,
+                   tessellation_timeout: Optional[float]) -> None:
+    if wire_mode not in WIRE_MODES:
+        raise ValueError(
+            f'wire_mode must be one of: {", ".join(WIRE_MODES)}.')
+    if reuse_triangulation and tessellation_backend != 'tessellate':
+        raise ValueError('reuse_triangulation requires the tessellate tessellation_backend.')
+    if tessellation_timeout is not None:
+        _check_fork_available()
+
+
+def _get_object_shapes(resolved_objects: Iterable[dict],
+                       resolved_slice: Optional[slice],
+                       copy_shapes: bool,
+                       export_link_array_elements: bool,
+                       cull_occluded: bool,
+                       refine: bool,
+                       copy_mesh: bool) -> Iterable[Tuple[dict, list]]:
+    """
+    Return each resolved object in resolved_slice along with its shapes,
+    each given as its index, the shape, and the placement
+    to transform its tessellation by or None.
+
+    Shapes are culled against those of every resolved object,
+    so when culling, the slice is taken after culling instead of before.
+    """
+    if resolved_slice is not None and not cull_occluded:
+        resolved_objects = islice(
+            resolved_objects, resolved_slice.start, resolved_slice.stop, resolved_slice.step)
+    object_shapes = _get_unprocessed_object_shapes(
+        resolved_objects, copy_shapes, export_link_array_elements, copy_mesh)
+    if cull_occluded:
+        object_shapes = _cull_enclosed_shapes(list(object_shapes))
+        if resolved_slice is not None:
+            object_shapes = object_shapes[resolved_slice]
+    if refine:
+        object_shapes = _refine_shapes(object_shapes)
+    return object_shapes
+
+
+def _get_unprocessed_object_shapes(resolved_objects: Iterable[dict],
+                                   copy_shapes: bool,
+                                   export_link_array_elements: bool,
+                                   copy_mesh: bool) -> Iterator[Tuple[dict, list]]:
+    for resolved_object in resolved_objects:
+        obj = resolved_object['object']
+        placement = resolved_object['placement']
+        if copy_shapes:
+            shapes = [(shape, None) for shape in get_shapes(
+                obj, placement, export_link_array_elements, copy_mesh)]
+        else:
+            shapes = _get_shapes_with_transforms(
+                obj, placement, export_link_array_elements)
+        yield resolved_object, [
+            (shape_index, shape, transform)
+            for shape_index, (shape, transform) in enumerate(shapes)
+        ]
+
+
+def _cull_enclosed_shapes(object_shapes: List[Tuple[dict, list]]) -> List[Tuple[dict, list]]:
+    """
+    Remove shapes enclosed by other shapes from the output of _get_object_shapes,
+    keeping the index of each remaining shape.
+    """
+    world_shapes = [
+        shape if transform is None else shape.transformed(transform.toMatrix())
+        for resolved_object, shapes in object_shapes
+        for shape_index, shape, transform in shapes
+    ]
+    enclosed_indices = get_enclosed_indices(world_shapes)
+    culled = []
+    index = 0
+    for resolved_object, shapes in object_shapes:
+        kept_shapes = []
+        for shape in shapes:
+            if index not in enclosed_indices:
+                kept_shapes.append(shape)
+            index += 1
+        culled.append((resolved_object, kept_shapes))
+    return culled
+
+
+def _refine_shapes(object_shapes: Iterable[Tuple[dict, list]]) -> Iterator[Tuple[dict, list]]:
+    """
+    Replace shapes from the output of _get_object_shapes with refined shapes,
+    moving their tessellations into place by a transform instead.
+
+    Refined shapes are cached by object and shape index,
+    so an object resolved by several links is refined once,
+    and each occurrence shares the refined shape.
+    """
+    refined_shapes = {}
+    for resolved_object, shapes in object_shapes:
+        obj = resolved_object['object']
+        refined = []
+        for shape_index, shape, transform in shapes:
+            key = (obj.Document.Name, obj.Name, shape_index)
+            if key not in refined_shapes:
+                refined_shapes[key] = _refine_shape(shape)
+            placement = shape.Placement
+            if transform is not None:
+                placement = transform.multiply(placement)
+            refined_transform = None if placement.isIdentity() else placement
+            refined.append((shape_index, refined_shapes[key], refined_transform))
+        yield resolved_object, refined
+
+
+def _refine_shape(shape):
+    """
+    Merge faces split by boolean operations, at an identity placement.
+    """
+    local_shape = shape.copy(False)
+    local_shape.Placement = Placement()
+    return local_shape.removeSplitter()
+
+
+def _get_object_name(object_name_getter: Callable[[object, List[object], int], str],
+                     obj: object,
+                     path: List[object],
+                     shape_index: int) -> str:
+    object_name = object_name_getter(obj, path, shape_index)
+    if type(object_name) != str:
+        raise ValueError('object_name_getter must return string.')
+    return object_name
+
+
+def _get_local_shape(shape, transform: Optional[Placement]) -> Tuple[object, Placement]:
+    """
+    Move a shape to an identity placement without copying it,
+    returning it along with the placement of the shape moved by transform.
+
+    Shapes are either copies made by get_shapes, or shapes read from
+    an object's Shape property, so moving them leaves objects unchanged.
+    """
+    placement = shape.Placement
+    if transform is not None:
+        placement = transform.multiply(placement)
+    shape.Placement = Placement()
+    return shape, placement
+
+
+def _get_backend(tessellation_backend: Union[str, Callable[[object, List[object], int], str]],
+                 mesh_settings: dict,
+                 obj: object,
+                 path: List[object],
+                 shape_index: int) -> Tuple[str, dict]:
+    """
+    Return the name of the backend triangulating a shape, and its mesh settings.
+    """
+    backend = tessellation_backend
+    if callable(tessellation_backend):
+        backend = tessellation_backend(obj, path, shape_index)
+    if backend not in TESSELLATION_BACKENDS:
+        raise ValueError(
+            f'tessellation_backend must be one of: {", ".join(TESSELLATION_BACKENDS)}.')
+    return backend, _get_backend_mesh_settings(backend, mesh_settings)
+
+
+def _get_backend_mesh_settings(backend: str, mesh_settings: dict) -> dict:
+    """
+    Return the mesh settings of a backend from mesh_settings,
+    which are either shared by every backend, or keyed by backend name.
+    """
+    if mesh_settings and all(key in TESSELLATION_BACKENDS for key in mesh_settings):
+        mesh_settings = mesh_settings.get(backend, default_mesh_settings)
+    accepted_keys = BACKEND_MESH_SETTINGS.get(backend)
+    if accepted_keys is None:
+        return mesh_settings
+    if mesh_settings == default_mesh_settings:
+        # Default mesh settings are for the standard backend,
+        # so other backends only take the keys they accept.
+        return {key: value for key, value in mesh_settings.items() if key in accepted_keys}
+    unknown_keys = set(mesh_settings) - accepted_keys
+    if unknown_keys:
+        raise ValueError(
+            f'mesh_settings {", ".join(sorted(unknown_keys))} not accepted by '
+            f'tessellation_backend {backend}, which accepts: {", ".join(sorted(accepted_keys))}.')
+    return mesh_settings
+
+
+def _tessellate_shape(shape,
+                      transform: Optional[Placement],
+                      settings: dict,
+                      preview: bool,
+                      tessellation_timeout: Optional[float],
+                      instance_cache: Optional[InstanceCache]) -> Tuple[dict, Optional[str]]:
+    """
+    Tessellate a shape, or reuse the tessellation of a congruent shape.
+
+    Returns the tessellation, and a description of a fallback if any.
+    """
+    if preview:
+        return _get_bound_box_tessellation(shape, transform), None
+    if not shape.Faces:
+        # Skip meshing shapes without faces, such as sketches.
+        return _get_edge_tessellation(shape, settings, transform), None
+    signature = instance_cache and get_signature(shape, transform)
+    if signature:
+        # Only reuse tessellations made by the same backend.
+        signature['fingerprint'] += (settings['backend'],)
+    instance = signature and instance_cache.find(signature)
+    if instance:
+        tessellation, instance_transform = instance
+        return _transform_tessellation(tessellation, instance_transform), None
+    failure = None
+    if tessellation_timeout is None:
+        tessellation = _tessellate(shape, settings, transform)
+    else:
+        tessellation, failure = _tessellate_with_timeout(
+            shape, settings, tessellation_timeout, transform)
+    if signature and not failure:
+        instance_cache.add(signature, tessellation)
+    return tessellation, failure
+
+
+def _get_edge_tessellation(shape, settings: dict, transform: Placement = None) -> dict:
+    """
+    Tessellate a shape without faces as an empty mesh,
+    with wires discretized from its edges.
+    """
+    return {
+        'mesh': ([], [], []),
+        'wires': get_wire_points(
+            shape, settings['wire_deflection'], transform, settings['wire_simplification']),
+        'wire_indices': None
+    }
+
+
+def _mesh_shape(shape, settings: dict, segments: bool = False) -> Tuple[tuple, Optional[List[List[int]]]]:
+    """
+    Triangulate a shape with the backend named in settings,
+    see TESSELLATION_BACKENDS.
+    """
+    backend = TESSELLATION_BACKENDS[settings['backend']]
+    return backend(shape, settings['mesh_settings'], segments)
+
+
+def mesh_with_standard(shape,
+                       mesh_settings: dict,
+                       segments: bool = False) -> Tuple[tuple, Optional[List[List[int]]]]:
     """
-    Return a tuple containing 3 lists:
+    Triangulate a shape with the Standard mesher of MeshPart.
 
-        1. vertexes
-        2. vertex normals
-        3. and face indices
+    Forwards all of mesh_settings to MeshPart.meshFromShape.
+    """
+    # Imported lazily, as MeshPart is only needed once tessellating.
+    import MeshPart
+
+    # Triangulates shapes with curves
+    if segments:
+        mesh = MeshPart.meshFromShape(Shape=shape, Segments=True, **mesh_settings)
+        face_triangles = [
+            list(mesh.getSegment(i)) for i in range(mesh.countSegments())]
+        return _get_mesh_topology(mesh), face_triangles
+    mesh = MeshPart.meshFromShape(Shape=shape, **mesh_settings)
+    return _get_mesh_topology(mesh), None
 
-    offset with a given amount.
+
+def mesh_with_mefisto(shape,
+                      mesh_settings: dict,
+                      segments: bool = False) -> Tuple[tuple, Optional[List[List[int]]]]:
+    """
+    Triangulate a shape with the Mefisto mesher of MeshPart.
+
+    Uses MaxLength from mesh_settings,
+    defaulting to a twentieth of the shape's diagonal.
     """
+    import MeshPart
+
+    max_length = mesh_settings.get(
+        'MaxLength', shape.BoundBox.DiagonalLength / 20)
+    mesh = MeshPart.meshFromShape(Shape=shape, MaxLength=max_length)
+    return _get_mesh_topology(mesh), None
+
+
+def mesh_with_netgen(shape,
+                     mesh_settings: dict,
+                     segments: bool = False) -> Tuple[tuple, Optional[List[List[int]]]]:
+    """
+    Triangulate a shape with the Netgen mesher of MeshPart,
+    if FreeCAD was built with Netgen.
+
+    Uses Fineness, SecondOrder, Optimize, and AllowQuad from mesh_settings.
+    """
+    import MeshPart
+
+    mesh = MeshPart.meshFromShape(
+        Shape=shape,
+        Fineness=mesh_settings.get('Fineness', 2),
+        SecondOrder=mesh_settings.get('SecondOrder', 0),
+        Optimize=mesh_settings.get('Optimize', 1),
+        AllowQuad=mesh_settings.get('AllowQuad', 0))
+    return _get_mesh_topology(mesh), None
+
+
+def mesh_with_tessellate(shape,
+                         mesh_settings: dict,
+                         segments: bool = False) -> Tuple[tuple, Optional[List[List[int]]]]:
+    """
+    Triangulate a shape with Part.Shape.tessellate, skipping MeshPart.
+
+    Uses LinearDeflection and Relative from mesh_settings,
+    where a relative deflection is relative to the shape's diagonal.
+    Facet normals are computed from the winding of each triangle.
+
+    Existing triangulations of faces at least as fine as the deflection
+    are reused, as the shape's triangulation is not cleaned first.
+    """
+    tolerance = mesh_settings.get('LinearDeflection', 0.1)
+    if mesh_settings.get('Relative', False):
+        tolerance *= shape.BoundBox.DiagonalLength
+    points, triangles = shape.tessellate(tolerance)
+    normals = []
+    for a, b, c in triangles:
+        normal = (points[b] - points[a]).cross(points[c] - points[a])
+        if normal.Length > 0:
+            normal.normalize()
+        normals.append(normal)
+    return (points, normals, triangles), None
+
+
+def _get_mesh_topology(mesh) -> tuple:
+    points, triangles = mesh.Topology
+    normals = [facet.Normal for facet in mesh.Facets]
+    return points, normals, triangles
+
+
+# Functions triangulating a shape, keyed by name.
+#
+# Each takes a shape, mesh settings, and whether to group triangles by face.
+# Each returns points, facet normals, and zero-based triangle indices,
+# along with the indices of the triangles of each face,
+# or None if triangles cannot be grouped by face.
+TESSELLATION_BACKENDS = {
+    'standard': mesh_with_standard,
+    'mefisto': mesh_with_mefisto,
+    'netgen': mesh_with_netgen,
+    'tessellate': mesh_with_tessellate
+}
+
+# Keys of mesh_settings accepted by each backend of TESSELLATION_BACKENDS.
+# Backends without an entry accept any keys.
+BACKEND_MESH_SETTINGS = {
+    'mefisto': {'MaxLength'},
+    'netgen': {'Fineness', 'SecondOrder', 'Optimize', 'AllowQuad'},
+    'tessellate': {'LinearDeflection', 'Relative'}
+}
+
+
+def _tessellate(shape, settings: dict, transform: Placement = None) -> dict:
+    """
+    Mesh a shape and derive its wires,
+    optionally transforming both by a placement.
+
+    Returns a dictionary with the mesh, wires, and wire_indices of a record.
+    Wires are discretized if the backend cannot group triangles by face.
+    """
+    mesh, face_triangles = _mesh_shape(
+        shape, settings, settings['wire_mode'] == 'triangulation')
+    mesh = _transform_mesh(mesh, transform)
+    if face_triangles is not None:
+        points, normals, triangles = mesh
+        wire_indices = []
+        for triangle_indices in face_triangles:
+            wire_indices.extend(
+                get_boundary_polylines(triangles, triangle_indices))
+        if settings['wire_simplification']:
+            tolerance = _get_simplification_tolerance(shape, settings['wire_simplification'])
+            wire_indices = [
+                [wire[i] for i in simplify_polyline([points[j] for j in wire], tolerance)]
+                for wire in wire_indices
+            ]
+        return {
+            'mesh': mesh,
+            'wires': [[points[i] for i in wire] for wire in wire_indices],
+            'wire_indices': wire_indices
+        }
+    return {
+        'mesh': mesh,
+        'wires': get_wire_points(
+            shape, settings['wire_deflection'], transform, settings['wire_simplification']),
+        'wire_indices': None
+    }
+
+
+def _tessellate_to_tuples(*args) -> dict:
+    """
+    Like _tessellate, but returns plain tuples
+    which can be sent between processes.
+    """
+    tessellation = _tessellate(*args)
+    points, normals, triangles = tessellation['mesh']
+    return {
+        'mesh': (
+            [tuple(point) for point in points],
+            [tuple(normal) for normal in normals],
+            [tuple(triangle) for triangle in triangles]
+        ),
+        'wires': [[tuple(point) for point in wire] for wire in tessellation['wires']],
+        'wire_indices': tessellation['wire_indices']
+    }
+
+
+def get_boundary_polylines(triangles: list, triangle_indices: List[int]) -> List[List[int]]:
+    """
+    Return the boundary of a group of triangles as polylines
+    of zero-based point indices. Closed polylines repeat their first point.
+
+    Edges used by exactly one triangle of the group form the boundary.
+    """
+    neighbours = _get_boundary_neighbours(triangles, triangle_indices)
+    polylines = []
+    visited: set = set()
+    # Start open polylines from their ends, before walking closed loops.
+    starts = [i for i in neighbours if len(neighbours[i]) != 2] + list(neighbours)
+    for start in starts:
+        for following in neighbours[start]:
+            if (start, following) not in visited:
+                polylines.append(_walk_boundary(
+                    neighbours, visited, start, following))
+    return polylines
+
+
+def _get_boundary_neighbours(triangles: list, triangle_indices: List[int]) -> dict:
+    """
+    Map each point on the boundary of a group of triangles
+    to its neighbours along the boundary.
+    """
+    edge_counts: dict = {}
+    for triangle_index in triangle_indices:
+        a, b, c = triangles[triangle_index]
+        for edge in ((a, b), (b, c), (c, a)):
+            key = (edge[0], edge[1]) if edge[0] < edge[1] else (edge[1], edge[0])
+            edge_counts[key] = edge_counts.get(key, 0) + 1
+    neighbours: dict = {}
+    for (a, b), count in edge_counts.items():
+        if count == 1:
+            neighbours.setdefault(a, []).append(b)
+            neighbours.setdefault(b, []).append(a)
+    return neighbours
+
+
+def _walk_boundary(neighbours: dict, visited: set, start: int, following: int) -> List[int]:
+    polyline = [start]
+    previous, current = start, following
+    while True:
+        visited.add((previous, current))
+        visited.add((current, previous))
+        polyline.append(current)
+        if current == start or len(neighbours[current]) != 2:
+            return polyline
+        unvisited = [i for i in neighbours[current] if (current, i) not in visited]
+        if not unvisited:
+            return polyline
+        previous, current = current, unvisited[0]
+
+
+def _get_bound_box_tessellation(shape, transform: Optional[Placement]) -> dict:
+    return {
+        'mesh': _transform_mesh(_get_bound_box_mesh(shape), transform),
+        'wires': [],
+        'wire_indices': None
+    }
+
+
+def _transform_tessellation(tessellation: dict, transform: Placement) -> dict:
+    return {
+        'mesh': _transform_mesh(tessellation['mesh'], transform),
+        'wires': _transform_wires(tessellation['wires'], transform),
+        'wire_indices': tessellation['wire_indices']
+    }
+
+
+def _transform_mesh(mesh: tuple, transform: Optional[Placement]) -> tuple:
+    """
+    Move mesh points by a placement and rotate its facet normals.
+    """
+    if transform is None:
+        return mesh
+    points, normals, triangles = mesh
+    rotation = transform.Rotation
+    return (
+        [transform.multVec(Vector(*point)) for point in points],
+        [rotation.multVec(Vector(*normal)) for normal in normals],
+        triangles
+    )
+
+
+def _transform_wires(wires: list, transform: Optional[Placement]) -> list:
+    if transform is None:
+        return wires
+    return [
+        [transform.multVec(Vector(*point)) for point in wire]
+        for wire in wires
+    ]
+
+
+def _tessellate_with_timeout(shape,
+                             settings: dict,
+                             timeout: float,
+                             transform: Placement = None) -> Tuple[dict, Optional[str]]:
+    """
+    Tessellate a shape with progressively coarser settings,
+    giving each attempt at most timeout seconds,
+    and fall back to a bounding box if every attempt times out,
+    or as soon as an attempt fails.
+
+    Returns the tessellation, and a description of the failure if any.
+    """
+    for factor in coarsening_factors:
+        coarse_settings = {
+            **settings,
+            'mesh_settings': _coarsen_mesh_settings(settings['mesh_settings'], factor),
+            'wire_deflection': settings['wire_deflection'] * factor
+        }
+        try:
+            tessellation = _run_with_timeout(
+                _tessellate_to_tuples,
+                (shape, coarse_settings, transform),
+                timeout)
+        except TimeoutError:
+            continue
+        except RuntimeError as error:
+            # Failures are not retried, as coarser settings rarely avoid them.
+            return _get_bound_box_tessellation(shape, transform), (
+                f'tessellation failed with {error}, exported as bounding box.')
+        if factor == 1:
+            return tessellation, None
+        return tessellation, (
+            f'tessellation exceeded {timeout} seconds, '
+            f'exported with mesh settings {coarse_settings["mesh_settings"]}.')
+    return _get_bound_box_tessellation(shape, transform), (
+        f'tessellation exceeded {timeout} seconds, '
+        'exported as bounding box.')
+
+
+def _coarsen_mesh_settings(mesh_settings: dict, factor: float) -> dict:
+    settings = dict(mesh_settings)
+    if 'LinearDeflection' in settings:
+        settings['LinearDeflection'] *= factor
+    if 'AngularDeflection' in settings:
+        settings['AngularDeflection'] = min(
+            settings['AngularDeflection'] * factor, pi / 2)
+    return settings
+
+
+def _check_fork_available() -> None:
+    import multiprocessing
+
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        raise ValueError(
+            'tessellation_timeout requires forking worker processes, '
+            'which this platform does not support.')
+
+
+def _run_with_timeout(function: Callable, args: tuple, timeout: float):
+    """
+    Call function with args in a forked process, returning its result.
+
+    Raises TimeoutError if it did not finish within timeout seconds,
+    and RuntimeError describing the exception it raised otherwise.
+
+    Forking gives the child a copy of the shape without serializing it,
+    so this is only available on POSIX platforms, see _check_fork_available.
+    """
+    import multiprocessing
+
+    context = multiprocessing.get_context('fork')
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_send_result, args=(sender, function, args), daemon=True)
+    process.start()
+    sender.close()
+    try:
+        if not receiver.poll(timeout):
+            raise TimeoutError()
+        try:
+            succeeded, result = receiver.recv()
+        except EOFError:
+            raise RuntimeError('worker exiting without a result')
+        if not succeeded:
+            raise RuntimeError(result)
+        return result
+    finally:
+        receiver.close()
+        if process.is_alive():
+            process.kill()
+        process.join()
+
+
+def _send_result(sender, function: Callable, args: tuple) -> None:
+    try:
+        sender.send((True, function(*args)))
+    except Exception as exception:
+        sender.send((False, repr(exception)))
+    finally:
+        sender.close()
+
+
+def _format_indices(points: list,
+                    normals: list,
+                    triangles: list,
+                    offsetv: int,
+                    offsetvn: int,
+                    precision: int = None) -> Tuple[List[str], List[str], List[str]]:
     vlist = []
     vnlist = []
     flist = []
 
-    # Triangulates shapes with curves
-    mesh = MeshPart.meshFromShape(Shape=shape, **mesh_settings)
-    for v in mesh.Topology[0]:
-        p = Draft.precision()
+    p = get_precision() if precision is None else precision
+    for v in points:
         vlist.append(str(round(v[0], p)) + ' ' +
                      str(round(v[1], p)) + ' ' +
                      str(round(v[2], p)))
 
-    for vn in mesh.Facets:
-        vnlist.append(str(vn.Normal[0]) + ' ' +
-                      str(vn.Normal[1]) + ' ' +
-                      str(vn.Normal[2]))
+    for vn in normals:
+        vnlist.append(str(vn[0]) + ' ' +
+                      str(vn[1]) + ' ' +
+                      str(vn[2]))
 
-    for i, vn in enumerate(mesh.Topology[1]):
+    for i, vn in enumerate(triangles):
         flist.append(str(vn[0] + offsetv) + '//' +
                      str(i + offsetvn) + ' ' +
                      str(vn[1] + offsetv) + '//' +
@@ -139,39 +1025,157 @@ def _get_indices(
     return vlist, vnlist, flist
 
 
-def get_wires(shape) -> List[List[Tuple[str, str, str]]]:
+def get_precision() -> int:
+    """
+    Return the number of decimals set in Draft preferences.
+
+    Equivalent to Draft.precision(),
+    without importing the Draft workbench.
+    """
+    parameters = App.ParamGet('User parameter:BaseApp/Preferences/Mod/Draft')
+    return parameters.GetInt('precision', 6)
+
+
+# Corners of a box are numbered by bits: 1 for x, 2 for y, and 4 for z.
+# Each side is listed counter-clockwise when viewed from outside.
+_BOX_SIDES = [
+    ((0, 4, 6, 2), Vector(-1, 0, 0)),
+    ((1, 3, 7, 5), Vector(1, 0, 0)),
+    ((0, 1, 5, 4), Vector(0, -1, 0)),
+    ((2, 6, 7, 3), Vector(0, 1, 0)),
+    ((0, 2, 3, 1), Vector(0, 0, -1)),
+    ((4, 5, 7, 6), Vector(0, 0, 1))
+]
+
+
+def _get_bound_box_mesh(shape) -> Tuple[list, list, list]:
+    """
+    Return the oriented bounding box of a shape as points, facet normals,
+    and zero-based triangle indices, in the same form as mesh backends.
+
+    The box is computed in the local frame of the shape,
+    and then moved into place with the shape's placement.
+    """
+    placement = shape.Placement
+    shape.Placement = Placement()
+    bound_box = shape.BoundBox
+    shape.Placement = placement
+
+    points = []
+    for z in (bound_box.ZMin, bound_box.ZMax):
+        for y in (bound_box.YMin, bound_box.YMax):
+            for x in (bound_box.XMin, bound_box.XMax):
+                points.append(placement.multVec(Vector(x, y, z)))
+
+    normals = []
+    triangles = []
+    for (a, b, c, d), normal in _BOX_SIDES:
+        rotated_normal = placement.Rotation.multVec(normal)
+        normals.extend([rotated_normal, rotated_normal])
+        triangles.extend([(a, b, c), (a, c, d)])
+    return points, normals, triangles
+
+
+def get_wires(shape,
+              deflection: float = None,
+              transform: Placement = None,
+              simplification: dict = None) -> List[List[Tuple[str, str, str]]]:
+    return [
+        [format_wire_vertex(vertex) for vertex in wire]
+        for wire in get_wire_points(shape, deflection, transform, simplification)
+    ]
+
+
+def get_wire_points(shape,
+                    deflection: float = None,
+                    transform: Placement = None,
+                    simplification: dict = None) -> List[list]:
+    """
+    Discretize the wires of each face of a shape into lists of points,
+    optionally simplified, and transformed by a placement.
+
+    Shapes without faces, such as sketches, are discretized by their edges,
+    with a list of points for each chain of connected edges.
+    """
+    if shape.Faces:
+        discretized_wires = [
+            discretize_wire(wire, deflection)
+            for face in shape.Faces
+            for wire in face.Wires]
+    else:
+        discretized_wires = [
+            discretize_wire(Part.Wire(edges), deflection)
+            for edges in Part.sortEdges(shape.Edges)]
+    tolerance = simplification and _get_simplification_tolerance(shape, simplification)
     wires = []
-    for face in shape.Faces:
-        for wire in face.Wires:
-            discretized_wire = discretize_wire(wire)
-            wire = []
-            for vertex in discretized_wire:
-                # use strings to avoid 0.00001 written as 1e-05
-                # TODO: This uses 5 decimal places of precision,
-                #       where we use p = Draft.precision() above.
-                #       We should make the precision consistent.
-                x = '{:.5f}'.format(vertex.x)
-                y = '{:.5f}'.format(vertex.y)
-                z = '{:.5f}'.format(vertex.z)
-                wire.append((x, y, z))
-            wires.append(wire)
+    for discretized_wire in discretized_wires:
+        if tolerance:
+            discretized_wire = [
+                discretized_wire[i]
+                for i in simplify_polyline(discretized_wire, tolerance)]
+        if transform is not None:
+            discretized_wire = [
+                transform.multVec(vertex) for vertex in discretized_wire]
+        wires.append(discretized_wire)
     return wires
 
 
-def discretize_wire(wire: Part.Wire) -> Part.Wire:
+def _get_simplification_tolerance(shape, simplification: dict) -> float:
+    tolerance = simplification.get('Tolerance', 0)
+    if simplification.get('Relative', False):
+        tolerance *= shape.BoundBox.DiagonalLength
+    return tolerance
+
+
+def format_wire_vertex(vertex) -> Tuple[str, str, str]:
+    # use strings to avoid 0.00001 written as 1e-05
+    # TODO: This uses 5 decimal places of precision,
+    #       where we use p = get_precision() above.
+    #       We should make the precision consistent.
+    x = '{:.5f}'.format(vertex[0])
+    y = '{:.5f}'.format(vertex[1])
+    z = '{:.5f}'.format(vertex[2])
+    return x, y, z
+
+
+def discretize_wire(wire: Part.Wire, deflection: float = None) -> Part.Wire:
+    if deflection is None:
+        deflection = default_wire_deflection
     wire_with_sorted_edges = Part.Wire(Part.__sortEdges__(wire.Edges))
-    return wire_with_sorted_edges.discretize(QuasiDeflection=0.005)
+    return wire_with_sorted_edges.discretize(QuasiDeflection=deflection)
 
 
-def get_shapes(obj: object, placement: Placement, export_link_array_elements: bool):
+def get_shapes(obj: object,
+               placement: Placement,
+               export_link_array_elements: bool,
+               copy_mesh: bool = False):
     if is_link_array(obj) and export_link_array_elements:
-        return [shape.copy(False) for shape in obj.Shape.SubShapes]
+        return [shape.copy(False, copy_mesh) for shape in obj.Shape.SubShapes]
     else:
-        shape = obj.Shape.copy(False)
+        shape = obj.Shape.copy(False, copy_mesh)
         shape.Placement = placement
         return [shape]
 
 
+def _get_shapes_with_transforms(obj: object,
+                                placement: Placement,
+                                export_link_array_elements: bool) -> List[Tuple[object, Optional[Placement]]]:
+    """
+    Like get_shapes, but without copying any shape.
+
+    Returns each shape paired with the placement to transform
+    its tessellation by, or None if it is already in place.
+    """
+    if is_link_array(obj) and export_link_array_elements:
+        return [(shape, None) for shape in obj.Shape.SubShapes]
+    else:
+        shape = obj.Shape
+        transform = placement.multiply(shape.Placement.inverse())
+        if transform.isIdentity():
+            return [(shape, None)]
+        return [(shape, transform)]
+
+
 def is_link_array(obj: object) -> bool:
     return (
         obj.TypeId == 'Part::FeaturePython' and
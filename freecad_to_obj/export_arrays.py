@@ -0,0 +1,43 @@
+from typing import List
+
+from .export import get_records
+
+__all__ = ['export_arrays']
+
+
+def export_arrays(export_list: List[object], **kwargs) -> List[dict]:
+    """
+    Transforms a list of objects into NumPy arrays of their geometry,
+    without formatting anything as text.
+
+    Takes the same keyword arguments as export.
+
+    Returns a list with a dictionary for each shape with the following keys:
+
+        * name: name of the object as it would be in export.
+        * label: Label of the resolved object.
+        * path: parents of the resolved object.
+        * vertices: float64 array of shape (n, 3).
+        * normals: float64 array of shape (m, 3) with a normal for each face.
+        * faces: int32 array of shape (m, 3) of zero-based indices into vertices.
+        * wires: list of float64 arrays of shape (k, 3), one for each wire.
+    """
+    # Imported lazily, as NumPy is only needed for this function.
+    import numpy as np
+
+    arrays = []
+    for record in get_records(export_list, **kwargs):
+        points, normals, triangles = record['mesh']
+        arrays.append({
+            'name': record['name'],
+            'label': record['object'].Label,
+            'path': record['path'],
+            'vertices': np.array(points, dtype=np.float64).reshape(-1, 3),
+            'normals': np.array(normals, dtype=np.float64).reshape(-1, 3),
+            'faces': np.array(triangles, dtype=np.int32).reshape(-1, 3),
+            'wires': [
+                np.array(wire, dtype=np.float64).reshape(-1, 3)
+                for wire in record['wires']
+            ]
+        })
+    return arrays
@@ -0,0 +1,146 @@
+from typing import Callable, Dict, Hashable, List, Tuple
+
+from .export import format_record, get_record_bounds, get_records, join_lines
+
+__all__ = ['export_batches']
+
+
+def export_batches(export_list: List[object],
+                   triangle_threshold: int = 256,
+                   batch_key: Callable[[
+                       object, List[object], int], Hashable] = None,
+                   batch_cell_size: float = None,
+                   **kwargs) -> Tuple[str, List[dict]]:
+    """
+    Transforms a list of objects into a Wavefront .obj file contents,
+    merging shapes with fewer than triangle_threshold triangles
+    into batches, so viewers draw fewer objects.
+
+    Small shapes are batched by either:
+
+        * batch_key: function returning a key for each shape,
+          with shapes of equal keys sharing a batch.
+        * batch_cell_size: size of the cells of a grid,
+          with shapes whose bounds are centered in the same cell sharing a batch.
+
+    By default, shapes are batched by the path of their parents.
+
+    Batches are named Batch0, Batch1, and so on, and written after other objects.
+    The wires of each batch are written as a single object, such as Batch0Wire.
+    A batch of a single shape is written as the shape itself.
+    Fallbacks of the shapes in a batch are reported in a comment preceding it.
+
+    Takes the same keyword arguments as export.
+
+    Returns the contents, along with an index to map picked geometry
+    back to each shape. The index is a list with a dictionary
+    for each shape with the following keys:
+
+        * name: name of the shape as it would be in export.
+        * label: Label of the resolved object.
+        * path: Names of the parents of the resolved object.
+        * object: name of the object the shape was written as.
+        * vertices: range of numbers of the shape's vertexes.
+        * faces: range of zero-based indices of the shape's faces within object.
+        * wires: range of zero-based indices of the shape's wires within object.
+
+    Ranges are given as [start, stop], excluding stop.
+    """
+    if batch_key is not None and batch_cell_size is not None:
+        raise ValueError('Only one of batch_key or batch_cell_size may be given.')
+
+    records = []
+    batches: Dict[Hashable, List[dict]] = {}
+    for record in get_records(export_list, **kwargs):
+        triangles = record['mesh'][2]
+        if len(triangles) < triangle_threshold:
+            if batch_cell_size is not None:
+                key = _get_cell_key(record, batch_cell_size)
+            else:
+                key = (batch_key or _get_parent_key)(
+                    record['object'], record['path'], record['shape_index'])
+            batches.setdefault(key, []).append(record)
+        else:
+            records.append([record])
+    batch_names = {}
+    for members in batches.values():
+        if len(members) > 1:
+            batch_names[id(members)] = f'Batch{len(batch_names)}'
+        records.append(members)
+
+    lines = []
+    index = []
+    # Vertex numbers start from 1 instead of 0
+    offsetv = 1
+    offsetvn = 1
+    for members in records:
+        name = batch_names.get(id(members), members[0]['name'])
+        record = _merge_records(name, members) if len(members) > 1 else members[0]
+        index.extend(_get_index_entries(name, members, offsetv))
+        record_lines, offsetv, offsetvn = format_record(record, offsetv, offsetvn)
+        lines.extend(record_lines)
+    return join_lines(lines), index
+
+
+def _merge_records(name: str, records: List[dict]) -> dict:
+    points = []
+    normals = []
+    triangles = []
+    wires = []
+    wire_indices = []
+    for record in records:
+        offset = len(points)
+        record_points, record_normals, record_triangles = record['mesh']
+        points.extend(record_points)
+        normals.extend(record_normals)
+        triangles.extend(
+            [index + offset for index in triangle] for triangle in record_triangles)
+        wires.extend(record['wires'])
+        if wire_indices is not None and record['wire_indices'] is not None:
+            wire_indices.extend(
+                [index + offset for index in wire] for wire in record['wire_indices'])
+        else:
+            # Wires of bounding box fallbacks have no indices,
+            # so the batch falls back to the points of every wire.
+            wire_indices = None
+    return {
+        'name': name,
+        'mesh': (points, normals, triangles),
+        'wires': wires,
+        'wire_indices': wire_indices,
+        'comment': ' '.join(
+            f'{record["name"]}: {record["comment"]}' for record in records if record['comment']) or None,
+        'merge_wires': True
+    }
+
+
+def _get_index_entries(name: str, records: List[dict], offsetv: int) -> List[dict]:
+    entries = []
+    face_start = 0
+    wire_start = 0
+    for record in records:
+        points, normals, triangles = record['mesh']
+        entries.append({
+            'name': record['name'],
+            'label': record['object'].Label,
+            'path': [o.Name for o in record['path']],
+            'object': name,
+            'vertices': [offsetv, offsetv + len(points)],
+            'faces': [face_start, face_start + len(triangles)],
+            'wires': [wire_start, wire_start + len(record['wires'])]
+        })
+        offsetv += len(points)
+        face_start += len(triangles)
+        wire_start += len(record['wires'])
+    return entries
+
+
+def _get_parent_key(obj: object, path: List[object], shape_index: int) -> tuple:
+    return tuple((o.Document.Name, o.Name) for o in path)
+
+
+def _get_cell_key(record: dict, cell_size: float) -> tuple:
+    bounds = get_record_bounds(record)
+    if bounds is None:
+        return ()
+    return tuple(int((bounds[axis] + bounds[axis + 3]) / 2 // cell_size) for axis in range(3))
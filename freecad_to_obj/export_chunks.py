@@ -0,0 +1,91 @@
+"""
+Module to export objects into a content-addressed store of chunks.
+
+Each shape is tessellated at an identity placement and written as a chunk,
+a Wavefront .obj file numbering its vertexes from 1, named by the SHA-256
+hash of its contents. Shapes with the same geometry share a chunk,
+even across exports of different documents or product configurations,
+so a store may be shared by many exports and cached indefinitely.
+
+Each export is described by a scene, listing the chunk and placement
+of each shape.
+"""
+import hashlib
+import json
+import os
+from typing import List
+
+from .export import format_record, get_records, join_lines
+
+__all__ = ['export_chunks']
+
+# Name of the object within each chunk,
+# which is the same for every chunk so names do not change hashes.
+CHUNK_OBJECT_NAME = 'Chunk'
+
+
+def export_chunks(export_list: List[object],
+                  directory: str,
+                  scene_path: str = None,
+                  **kwargs) -> dict:
+    """
+    Transforms a list of objects into chunks written to directory,
+    skipping chunks already in it, along with a scene
+    written as JSON to scene_path if given.
+
+    Takes the same keyword arguments as export.
+
+    Returns the scene, which is a dictionary with the following keys:
+
+        * objects: list of shapes, each a dictionary with the following keys:
+            * name: name of the shape as it would be in export.
+            * label: Label of the resolved object.
+            * path: Names of the parents of the resolved object.
+            * chunk: name of the shape's chunk, without its .obj extension.
+            * placement: row-major 4x4 matrix as a list of 16 numbers,
+              moving the chunk into place.
+            * comment: description of a tessellation fallback, or None.
+        * chunks: names of chunks written by this export,
+          which were not already in directory.
+    """
+    os.makedirs(directory, exist_ok=True)
+    objects = []
+    written_chunks = []
+    for record in get_records(export_list, local_frame=True, **kwargs):
+        # Vertex numbers start from 1 instead of 0
+        lines, offsetv, offsetvn = format_record(
+            {**record, 'name': CHUNK_OBJECT_NAME, 'comment': None}, 1, 1)
+        contents = join_lines(lines).encode('utf-8')
+        chunk = hashlib.sha256(contents).hexdigest()
+        if _write_chunk(directory, chunk, contents):
+            written_chunks.append(chunk)
+        objects.append({
+            'name': record['name'],
+            'label': record['object'].Label,
+            'path': [o.Name for o in record['path']],
+            'chunk': chunk,
+            'placement': list(record['shape_placement'].toMatrix().A),
+            'comment': record['comment']
+        })
+
+    scene = {'objects': objects, 'chunks': written_chunks}
+    if scene_path is not None:
+        with open(scene_path, 'w') as f:
+            json.dump(scene, f, indent=2)
+    return scene
+
+
+def _write_chunk(directory: str, chunk: str, contents: bytes) -> bool:
+    """
+    Write a chunk unless it exists, returning whether it was written.
+    """
+    path = os.path.join(directory, chunk + '.obj')
+    if os.path.exists(path):
+        return False
+    # Write to a temporary file first,
+    # so concurrent exports never see a partial chunk.
+    temporary_path = f'{path}.{os.getpid()}.tmp'
+    with open(temporary_path, 'wb') as f:
+        f.write(contents)
+    os.replace(temporary_path, path)
+    return True
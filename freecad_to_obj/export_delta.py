@@ -0,0 +1,145 @@
+"""
+Module to export only what changed since a previous export.
+
+Each shape is fingerprinted by a key derived from its path,
+its name, a hash of its geometry at an identity placement,
+and its placement. Geometry is hashed once per object,
+however many links resolve to it. Comparing fingerprints with those of a previous
+export tells which shapes were removed, which need new geometry,
+and which only moved.
+
+Fingerprints are only comparable between exports with the same options,
+as options such as mesh_settings change geometry without changing hashes.
+"""
+import hashlib
+from collections import Counter
+from typing import Dict, List, Optional
+
+from FreeCAD import Matrix, Placement
+
+from .export import format_records, get_records, join_lines
+
+__all__ = ['export_delta']
+
+# Decimal places of placement matrices compared in fingerprints.
+PLACEMENT_DECIMALS = 9
+
+
+def export_delta(export_list: List[object],
+                 previous_fingerprints: Optional[Dict[str, dict]] = None,
+                 **kwargs) -> dict:
+    """
+    Transforms a list of objects into the changes
+    since an export with previous_fingerprints.
+
+    Without previous fingerprints, every shape is added.
+
+    Takes the same keyword arguments as export.
+
+    Returns a dictionary with the following keys:
+
+        * removed: names of shapes which no longer exist,
+          and previous names of renamed shapes.
+        * obj: Wavefront .obj file contents of added shapes,
+          and of shapes whose geometry or name changed.
+        * transforms: list of shapes which only moved,
+          each a dictionary with the following keys:
+            * name: name of the shape.
+            * transform: row-major 4x4 matrix as a list of 16 numbers,
+              moving the previously exported vertices into place.
+        * fingerprints: fingerprints of this export, keyed by shape,
+          to pass as previous_fingerprints to the next export.
+          They only contain lists, strings, and numbers,
+          so may be stored as JSON.
+    """
+    previous_fingerprints = previous_fingerprints or {}
+    fingerprints = {}
+    transforms = []
+    shape_hashes = {}
+    occurrences = Counter()
+
+    def shape_filter(entry: dict) -> bool:
+        key = get_key(entry['object'], entry['path'], entry['shape_index'])
+        occurrences[key] += 1
+        if occurrences[key] > 1:
+            # Tell apart an object resolved twice through the same path.
+            key += f'#{occurrences[key] - 1}'
+        fingerprint = get_fingerprint(entry, shape_hashes)
+        fingerprints[key] = fingerprint
+        previous = previous_fingerprints.get(key)
+        if (previous is None or
+                previous['name'] != fingerprint['name'] or
+                previous['shape_hash'] != fingerprint['shape_hash']):
+            return True
+        if previous['placement'] != fingerprint['placement']:
+            transforms.append({
+                'name': fingerprint['name'],
+                'transform': _get_transform(previous['placement'], fingerprint['placement'])
+            })
+        return False
+
+    records = get_records(export_list, shape_filter=shape_filter, **kwargs)
+    # Vertex numbers start from 1 instead of 0
+    lines, offsetv, offsetvn = format_records(records, 1, 1)
+    removed = [
+        previous['name']
+        for key, previous in previous_fingerprints.items()
+        if key not in fingerprints or fingerprints[key]['name'] != previous['name']
+    ]
+    return {
+        'removed': removed,
+        'obj': join_lines(lines),
+        'transforms': transforms,
+        'fingerprints': fingerprints
+    }
+
+
+def get_key(obj: object, path: List[object], shape_index: int) -> str:
+    """
+    Identify a shape by the Names of the objects it resolves through,
+    which stay the same when objects are renamed by Label.
+    """
+    names = [f'{o.Document.Name}#{o.Name}' for o in path + [obj]]
+    return '/'.join(names) + f'[{shape_index}]'
+
+
+def get_fingerprint(entry: dict, shape_hashes: Optional[Dict[tuple, str]] = None) -> dict:
+    """
+    Fingerprint a shape given as passed to the shape_filter of get_records.
+
+    Hashes are looked up in and added to shape_hashes if given,
+    keyed by the document, Name, and shape index of the object.
+    """
+    shape = entry['shape']
+    placement = shape.Placement
+    if entry['transform'] is not None:
+        placement = entry['transform'].multiply(placement)
+    obj = entry['object']
+    hash_key = (obj.Document.Name, obj.Name, entry['shape_index'])
+    if shape_hashes is None:
+        shape_hash = get_shape_hash(shape)
+    elif hash_key in shape_hashes:
+        shape_hash = shape_hashes[hash_key]
+    else:
+        shape_hash = shape_hashes[hash_key] = get_shape_hash(shape)
+    return {
+        'name': entry['name'],
+        'shape_hash': shape_hash,
+        'placement': [round(value, PLACEMENT_DECIMALS) for value in placement.toMatrix().A]
+    }
+
+
+def get_shape_hash(shape) -> str:
+    """
+    Hash the boundary representation of a shape at an identity placement,
+    so moving a shape keeps its hash.
+    """
+    local_shape = shape.copy(False)
+    local_shape.Placement = Placement()
+    brep = local_shape.exportBrepToString()
+    return hashlib.sha256(brep.encode('utf-8')).hexdigest()
+
+
+def _get_transform(previous_placement: List[float], placement: List[float]) -> List[float]:
+    transform = Matrix(*placement) * Matrix(*previous_placement).inverse()
+    return list(transform.A)
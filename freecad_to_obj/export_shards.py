@@ -0,0 +1,95 @@
+from typing import Callable, Dict, Hashable, List
+
+from .export import format_record, get_records, join_lines
+from .merge import rebase_line
+
+__all__ = ['export_shards']
+
+
+def export_shards(export_list: List[object],
+                  shard_key: Callable[[
+                      object, List[object], int], Hashable] = None,
+                  shard_size: int = None,
+                  **kwargs) -> List[str]:
+    """
+    Transforms a list of objects into several Wavefront .obj file contents,
+    each numbering its vertexes from 1 so it can be loaded on its own.
+
+    Objects are resolved and tessellated once, and split into shards by either:
+
+        * shard_key: function returning a key for each shape,
+          with shapes of equal keys sharing a shard.
+        * shard_size: target size of each shard in bytes of UTF-8.
+          A shard is started once adding a shape would exceed the size.
+
+    By default, shapes are split by the top-level object they resolve from.
+
+    Takes the same keyword arguments as export.
+    """
+    if shard_key is not None and shard_size is not None:
+        raise ValueError('Only one of shard_key or shard_size may be given.')
+    records = get_records(export_list, **kwargs)
+    if shard_size is not None:
+        return _shard_by_size(records, shard_size)
+    return _shard_by_key(records, shard_key or _get_top_level_key)
+
+
+def _shard_by_key(records, shard_key) -> List[str]:
+    # Lines and vertex offsets of each shard, in order of first appearance.
+    shards: Dict[Hashable, list] = {}
+    for record in records:
+        key = shard_key(record['object'], record['path'], record['shape_index'])
+        if key not in shards:
+            # Vertex numbers start from 1 instead of 0
+            shards[key] = [[], 1, 1]
+        shard = shards[key]
+        lines, shard[1], shard[2] = format_record(record, shard[1], shard[2])
+        shard[0].extend(lines)
+    return [join_lines(lines) for lines, offsetv, offsetvn in shards.values()]
+
+
+def _shard_by_size(records, shard_size: int) -> List[str]:
+    shards = []
+    shard_lines: List[str] = []
+    shard_length = 0
+    offsetv = 1
+    offsetvn = 1
+    for record in records:
+        lines, next_offsetv, next_offsetvn = format_record(
+            record, offsetv, offsetvn)
+        length = _get_length(lines)
+        if shard_lines and shard_length + length > shard_size:
+            shards.append(join_lines(shard_lines))
+            shard_lines = []
+            shard_length = 0
+            # Number the record from 1 in the new shard, instead of formatting it again.
+            offsets = [1 - offsetv, 0, 1 - offsetvn]
+            lines = [
+                rebase_line(line, offsets) if line.startswith(('f ', 'l ')) else line
+                for line in lines
+            ]
+            next_offsetv += offsets[0]
+            next_offsetvn += offsets[2]
+            length = _get_length(lines)
+        shard_lines.extend(lines)
+        shard_length += length
+        offsetv, offsetvn = next_offsetv, next_offsetvn
+    if shard_lines:
+        shards.append(join_lines(shard_lines))
+    return shards
+
+
+def _get_length(lines: List[str]) -> int:
+    """
+    Return the size of lines in bytes of UTF-8, including trailing newlines.
+    """
+    # Lines of ASCII, such as all but names and comments, are measured without encoding them.
+    return sum(
+        len(line) if line.isascii() else len(line.encode('utf-8'))
+        for line in lines
+    ) + len(lines)
+
+
+def _get_top_level_key(obj: object, path: List[object], shape_index: int) -> tuple:
+    top_level_object = path[0] if path else obj
+    return top_level_object.Document.Name, top_level_object.Name
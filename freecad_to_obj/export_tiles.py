@@ -0,0 +1,142 @@
+import json
+import os
+from typing import List, Optional
+
+from .export import format_records, get_record_bounds, get_records, join_lines
+
+__all__ = ['export_tiles']
+
+INDEX_FILENAME = 'tiles.json'
+
+
+def export_tiles(export_list: List[object],
+                 directory: str,
+                 max_tile_objects: int = 64,
+                 max_depth: int = 8,
+                 **kwargs) -> dict:
+    """
+    Transforms a list of objects into spatial tiles of an octree,
+    writing a Wavefront .obj file for each tile to a directory,
+    along with an index of tiles named tiles.json.
+
+    Each shape is placed into the smallest octree node containing
+    its world-space bounds. A node is split into octants once it holds
+    more than max_tile_objects shapes, unless it is max_depth deep.
+
+    Each tile numbers its vertexes from 1, so it can be loaded on its own.
+
+    Takes the same keyword arguments as export.
+
+    Returns the index, which is a dictionary with the following keys:
+
+        * bounds: bounds of the root node.
+        * tiles: list of tiles, each a dictionary with the following keys:
+            * id: "r" followed by the octant of each node from the root.
+            * file: name of the tile's .obj file.
+            * depth: depth of the tile's node.
+            * bounds: bounds of the tile's node.
+            * bytes: size of the tile's .obj file.
+            * objects: names of objects in the tile.
+
+    Bounds are given as [xmin, ymin, zmin, xmax, ymax, zmax].
+    """
+    entries = []
+    for record in get_records(export_list, **kwargs):
+        entries.append((record, get_record_bounds(record)))
+    bounded_entries = [entry for entry in entries if entry[1] is not None]
+    root_bounds = _union([bounds for record, bounds in bounded_entries])
+
+    os.makedirs(directory, exist_ok=True)
+    tiles: List[dict] = []
+    if root_bounds is not None:
+        _write_node(directory, 'r', 0, root_bounds, bounded_entries,
+                    max_tile_objects, max_depth, tiles)
+    unbounded_records = [record for record, bounds in entries if bounds is None]
+    if unbounded_records:
+        _write_tile(directory, 'unbounded', None, None, unbounded_records, tiles)
+
+    index = {'bounds': root_bounds, 'tiles': tiles}
+    with open(os.path.join(directory, INDEX_FILENAME), 'w') as f:
+        json.dump(index, f, indent=2)
+    return index
+
+
+def _write_node(directory: str,
+                node_id: str,
+                depth: int,
+                bounds: List[float],
+                entries: List[tuple],
+                max_tile_objects: int,
+                max_depth: int,
+                tiles: List[dict]) -> None:
+    if len(entries) <= max_tile_objects or depth == max_depth:
+        _write_tile(directory, node_id, depth, bounds,
+                    [record for record, record_bounds in entries], tiles)
+        return
+    octants = [_get_octant_bounds(bounds, octant) for octant in range(8)]
+    kept_records = []
+    octant_entries: List[List[tuple]] = [[] for octant in octants]
+    for record, record_bounds in entries:
+        for octant, octant_bounds in enumerate(octants):
+            if _contains(octant_bounds, record_bounds):
+                octant_entries[octant].append((record, record_bounds))
+                break
+        else:
+            # Shapes straddling octants stay in this node.
+            kept_records.append(record)
+    if kept_records:
+        _write_tile(directory, node_id, depth, bounds, kept_records, tiles)
+    for octant, child_entries in enumerate(octant_entries):
+        if child_entries:
+            _write_node(directory, node_id + str(octant), depth + 1,
+                        octants[octant], child_entries,
+                        max_tile_objects, max_depth, tiles)
+
+
+def _write_tile(directory: str,
+                tile_id: str,
+                depth: Optional[int],
+                bounds: Optional[List[float]],
+                records: List[dict],
+                tiles: List[dict]) -> None:
+    filename = f'tile_{tile_id}.obj'
+    # Vertex numbers start from 1 instead of 0
+    lines, offsetv, offsetvn = format_records(records, 1, 1)
+    contents = join_lines(lines).encode('utf-8')
+    with open(os.path.join(directory, filename), 'wb') as f:
+        f.write(contents)
+    tiles.append({
+        'id': tile_id,
+        'file': filename,
+        'depth': depth,
+        'bounds': bounds,
+        'bytes': len(contents),
+        'objects': [record['name'] for record in records]
+    })
+
+
+def _union(bounds_list: List[List[float]]) -> Optional[List[float]]:
+    if not bounds_list:
+        return None
+    return (
+        [min(bounds[i] for bounds in bounds_list) for i in range(3)] +
+        [max(bounds[i] for bounds in bounds_list) for i in range(3, 6)]
+    )
+
+
+def _get_octant_bounds(bounds: List[float], octant: int) -> List[float]:
+    """
+    Octants are numbered by bits: 1 for upper x, 2 for upper y, and 4 for upper z.
+    """
+    octant_bounds = list(bounds)
+    for axis in range(3):
+        center = (bounds[axis] + bounds[axis + 3]) / 2
+        if octant & (1 << axis):
+            octant_bounds[axis] = center
+        else:
+            octant_bounds[axis + 3] = center
+    return octant_bounds
+
+
+def _contains(outer: List[float], inner: List[float]) -> bool:
+    return all(outer[i] <= inner[i] and inner[i + 3] <= outer[i + 3] for i in range(3))
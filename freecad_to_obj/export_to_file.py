@@ -0,0 +1,150 @@
+import json
+import os
+from typing import Iterable, Iterator, List, Tuple
+
+from .export import format_record, get_precision, get_record_bounds, get_records
+from .pipeline import iterate_in_thread
+
+__all__ = ['export_to_file']
+
+
+def export_to_file(export_list: List[object],
+                   path: str,
+                   manifest_path: str = None,
+                   pipelined: bool = False,
+                   queue_size: int = 8,
+                   **kwargs) -> dict:
+    """
+    Transforms a list of objects into a Wavefront .obj file written to path,
+    writing each object as soon as it is tessellated,
+    so the contents are never held in memory at once.
+
+    When pipelined, resolving, tessellating, formatting, and writing each run
+    in their own thread, connected by queues of at most queue_size objects.
+    Resolving and tessellating only take turns within FreeCAD,
+    as neither releases the global interpreter lock while calling into it,
+    and each record is copied as plain data before being formatted.
+    A pipelined export cannot have a tessellation_timeout,
+    as forking the tessellation worker from a thread may deadlock.
+    See the pipeline module.
+
+    Along with the file, a manifest is built so clients can fetch
+    individual objects with HTTP range requests,
+    and written as JSON to manifest_path if given.
+
+    Takes the same keyword arguments as export.
+
+    Returns the manifest, which is a dictionary with the following keys:
+
+        * file: name of the .obj file.
+        * bytes: size of the .obj file.
+        * objects: list of objects, each a dictionary with the following keys:
+            * name: name of the object.
+            * label: Label of the resolved object.
+            * path: Names of the parents of the resolved object.
+            * offset: byte offset of the object within the file.
+            * length: length of the object in bytes, including its wires.
+            * vertices: range of numbers of the object's vertexes.
+            * normals: range of numbers of the object's vertex normals.
+            * bounds: world-space bounds of the object, or None if it is empty.
+
+    Ranges are given as [start, stop], excluding stop,
+    so clients fetching a single object can rebase its indices
+    by subtracting start - 1.
+    Bounds are given as [xmin, ymin, zmin, xmax, ymax, zmax].
+    """
+    if pipelined and kwargs.get('tessellation_timeout') is not None:
+        raise ValueError('pipelined export cannot be combined with tessellation_timeout.')
+    if pipelined:
+        records = get_records(
+            export_list, resolve_stage=lambda object_shapes: iterate_in_thread(object_shapes, queue_size), **kwargs)
+        records = iterate_in_thread(map(_get_plain_record, records), queue_size)
+    else:
+        records = map(_get_labeled_record, get_records(export_list, **kwargs))
+    blocks = _format_blocks(records, get_precision())
+    if pipelined:
+        blocks = iterate_in_thread(blocks, queue_size)
+
+    objects = []
+    offset = 0
+    with open(path, 'wb') as f:
+        for contents, entry in blocks:
+            f.write(contents)
+            objects.append({
+                'name': entry['name'],
+                'label': entry['label'],
+                'path': entry['path'],
+                'offset': offset,
+                'length': len(contents),
+                'vertices': entry['vertices'],
+                'normals': entry['normals'],
+                'bounds': entry['bounds']
+            })
+            offset += len(contents)
+
+    manifest = {
+        'file': os.path.basename(path),
+        'bytes': offset,
+        'objects': objects
+    }
+    if manifest_path is not None:
+        with open(manifest_path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def _get_plain_record(record: dict) -> dict:
+    """
+    Copy what formatting needs of a record from get_records as plain data,
+    with the Label and Names of its object and path,
+    so it can be formatted without touching FreeCAD.
+    """
+    points, normals, triangles = record['mesh']
+    return {
+        'name': record['name'],
+        'label': record['object'].Label,
+        'path': [o.Name for o in record['path']],
+        'mesh': (
+            [(p[0], p[1], p[2]) for p in points],
+            [(n[0], n[1], n[2]) for n in normals],
+            [tuple(triangle) for triangle in triangles]
+        ),
+        'wires': [[(v[0], v[1], v[2]) for v in wire] for wire in record['wires']],
+        'wire_indices': record['wire_indices'],
+        'comment': record['comment'],
+        'merge_wires': record['merge_wires']
+    }
+
+
+def _get_labeled_record(record: dict) -> dict:
+    """
+    Add the Label and Names of the object and path of a record from get_records,
+    without copying its geometry.
+    """
+    return {
+        **record,
+        'label': record['object'].Label,
+        'path': [o.Name for o in record['path']]
+    }
+
+
+def _format_blocks(records: Iterable[dict], precision: int) -> Iterator[Tuple[bytes, dict]]:
+    """
+    Format each labeled or plain record into the bytes of its block,
+    along with what the manifest needs to know of it besides its offset.
+    """
+    # Vertex numbers start from 1 instead of 0
+    offsetv = 1
+    offsetvn = 1
+    for record in records:
+        lines, next_offsetv, next_offsetvn = format_record(record, offsetv, offsetvn, precision)
+        contents = ''.join(line + '\n' for line in lines).encode('utf-8')
+        yield contents, {
+            'name': record['name'],
+            'label': record['label'],
+            'path': record['path'],
+            'vertices': [offsetv, next_offsetv],
+            'normals': [offsetvn, next_offsetvn],
+            'bounds': get_record_bounds(record)
+        }
+        offsetv, offsetvn = next_offsetv, next_offsetvn
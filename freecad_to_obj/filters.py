@@ -0,0 +1,76 @@
+import re
+from fnmatch import translate
+from typing import Dict, List
+
+__all__ = ['CompiledFilter', 'compile_filter']
+
+FILTER_KEYS = {'type_ids', 'labels', 'invisible', 'min_depth'}
+
+
+class CompiledFilter:
+    """
+    Filter compiled from a declarative specification, see compile_filter.
+
+    Called like a filter function with an object and its path.
+    Given as ignore_object to resolve_objects, a min_depth prunes
+    the children of objects at that depth without visiting them.
+    """
+
+    def __init__(self, spec: dict):
+        unknown_keys = set(spec) - FILTER_KEYS
+        if unknown_keys:
+            raise ValueError(
+                f'Unknown filter keys: {", ".join(sorted(unknown_keys))}.')
+        for key in ['type_ids', 'labels']:
+            if isinstance(spec.get(key), str):
+                raise ValueError(f'{key} must be a collection of strings, not a string.')
+
+        self.type_ids = frozenset(spec.get('type_ids', ()))
+        patterns = spec.get('labels', ())
+        self.label_regex = re.compile(
+            '|'.join(translate(pattern) for pattern in patterns)) if patterns else None
+        self.invisible = spec.get('invisible', False)
+        self.min_depth = spec.get('min_depth')
+        # Whether each Label seen so far matches a pattern.
+        self.label_matches: Dict[str, bool] = {}
+
+    def __call__(self, obj: object, path: List[object]) -> bool:
+        return (
+            self.matches_depth(len(path)) or
+            obj.TypeId in self.type_ids or
+            self._matches_label(obj.Label) or
+            (self.invisible and not obj.Visibility)
+        )
+
+    def matches_depth(self, depth: int) -> bool:
+        """
+        Return whether every object nested in depth parents matches.
+        """
+        return self.min_depth is not None and depth >= self.min_depth
+
+    def _matches_label(self, label: str) -> bool:
+        if self.label_regex is None:
+            return False
+        if label not in self.label_matches:
+            self.label_matches[label] = self.label_regex.match(label) is not None
+        return self.label_matches[label]
+
+
+def compile_filter(spec: dict) -> CompiledFilter:
+    """
+    Compile a declarative filter specification into a filter
+    usable for do_not_export or keep_unresolved.
+
+    An object matches the filter if any of the following hold:
+
+        * type_ids: its TypeId is in the given collection.
+        * labels: its Label matches any of the given glob patterns.
+        * invisible: it is invisible, if set to True.
+        * min_depth: its path has at least this many parents.
+
+    Only objects visited while resolving are matched, reading their
+    TypeId, Label, and visibility each time, so a compiled filter
+    stays correct after a document changes. Whether a Label matches
+    is remembered, so each distinct Label is only matched once.
+    """
+    return CompiledFilter(spec)
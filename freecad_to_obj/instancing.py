@@ -0,0 +1,137 @@
+"""
+Module to detect congruent shapes, so they can be tessellated once.
+
+Shapes are congruent if one can be moved onto the other by a rotation
+and translation. Candidates are found by a fingerprint of pose-invariant
+properties, and then confirmed by moving the vertexes of one shape
+onto the other through their frames of principal axes of inertia.
+
+Only shapes consisting of a single solid are supported.
+"""
+from typing import Dict, List, Optional, Tuple
+
+from FreeCAD import Placement, Rotation, Vector
+
+__all__ = ['InstanceCache', 'get_signature']
+
+# Significant digits of properties compared in fingerprints.
+SIGNIFICANT_DIGITS = 6
+
+# Tolerance of matching vertexes, relative to the size of a shape.
+RELATIVE_TOLERANCE = 1e-5
+
+# Rotations by 180 degrees about each principal axis,
+# which map a frame of principal axes onto its alternatives.
+_AXIS_FLIPS = [
+    Placement(),
+    Placement(Vector(), Rotation(Vector(1, 0, 0), 180)),
+    Placement(Vector(), Rotation(Vector(0, 1, 0), 180)),
+    Placement(Vector(), Rotation(Vector(0, 0, 1), 180))
+]
+
+
+class InstanceCache:
+    """
+    Tessellations of shapes keyed by fingerprint,
+    for reuse by congruent shapes.
+    """
+
+    def __init__(self):
+        self.representatives: Dict[tuple, List[Tuple[dict, tuple]]] = {}
+
+    def find(self, signature: dict) -> Optional[Tuple[tuple, Placement]]:
+        """
+        Return the tessellation of a shape congruent to the signature,
+        along with the placement moving it onto the signed shape,
+        or None if no such shape was added.
+        """
+        for representative, tessellation in self.representatives.get(signature['fingerprint'], []):
+            transform = _find_congruence(representative, signature)
+            if transform is not None:
+                return tessellation, transform
+        return None
+
+    def add(self, signature: dict, tessellation: tuple) -> None:
+        self.representatives.setdefault(
+            signature['fingerprint'], []).append((signature, tessellation))
+
+
+def get_signature(shape, transform: Placement = None) -> Optional[dict]:
+    """
+    Return the fingerprint, frame of principal axes, and vertexes of a shape,
+    moved by transform if given, or None if the shape is not a single solid.
+    """
+    if len(shape.Solids) != 1:
+        return None
+    solid = shape.Solids[0]
+    properties = solid.PrincipalProperties
+    # Order axes by their moments so congruent shapes agree on the order.
+    moments, axes = zip(*sorted(zip(properties['Moments'], [
+        properties['FirstAxisOfInertia'],
+        properties['SecondAxisOfInertia'],
+        properties['ThirdAxisOfInertia']
+    ]), key=lambda moment_and_axis: moment_and_axis[0]))
+    principal_placement = _get_frame(solid.CenterOfMass, axes[0], axes[1])
+    vertexes = [vertex.Point for vertex in solid.Vertexes]
+    if transform is not None:
+        principal_placement = transform.multiply(principal_placement)
+        vertexes = [transform.multVec(vertex) for vertex in vertexes]
+
+    inverse = principal_placement.inverse()
+    local_vertexes = [inverse.multVec(vertex) for vertex in vertexes]
+    extents = sorted(
+        max(v[axis] for v in local_vertexes) - min(v[axis] for v in local_vertexes)
+        for axis in range(3)
+    ) if local_vertexes else []
+    fingerprint = (
+        len(solid.Faces),
+        len(solid.Edges),
+        len(solid.Vertexes),
+        _round(solid.Volume),
+        _round(solid.Area),
+        *(_round(moment) for moment in moments),
+        *(_round(extent) for extent in extents)
+    )
+    return {
+        'fingerprint': fingerprint,
+        'placement': principal_placement,
+        'vertexes': vertexes,
+        'tolerance': RELATIVE_TOLERANCE * solid.BoundBox.DiagonalLength
+    }
+
+
+def _find_congruence(representative: dict, signature: dict) -> Optional[Placement]:
+    """
+    Return the placement moving the representative onto the signed shape,
+    or None if their vertexes do not match.
+
+    Principal axes are only defined up to their direction,
+    so each alternative frame of the signed shape is tried.
+    """
+    tolerance = signature['tolerance']
+    if tolerance <= 0:
+        return None
+    target = {_snap(vertex, tolerance) for vertex in signature['vertexes']}
+    inverse = representative['placement'].inverse()
+    for flip in _AXIS_FLIPS:
+        transform = signature['placement'].multiply(flip).multiply(inverse)
+        if all(_snap(transform.multVec(vertex), tolerance) in target
+               for vertex in representative['vertexes']):
+            return transform
+    return None
+
+
+def _get_frame(origin: Vector, x_axis: Vector, y_axis: Vector) -> Placement:
+    x_axis = Vector(x_axis).normalize()
+    y_axis = Vector(y_axis).normalize()
+    # Derive the third axis so the frame is right-handed.
+    z_axis = x_axis.cross(y_axis)
+    return Placement(origin, Rotation(x_axis, y_axis, z_axis, 'ZXY'))
+
+
+def _snap(vertex: Vector, tolerance: float) -> tuple:
+    return tuple(round(coordinate / tolerance) for coordinate in vertex)
+
+
+def _round(value: float) -> float:
+    return float(f'{value:.{SIGNIFICANT_DIGITS}g}')
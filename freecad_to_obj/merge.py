@@ -0,0 +1,53 @@
+from typing import Iterable, List
+
+from .export import join_lines
+
+__all__ = ['merge']
+
+
+def merge(fragments: Iterable[str]) -> str:
+    """
+    Merge Wavefront .obj file contents which each number
+    their vertexes from 1, such as those exported by separate processes,
+    into one without tessellating anything again.
+
+    Vertex references of f and l records are rebased by the number of
+    v, vt, and vn records of preceding fragments in a single pass.
+    Relative references, which are negative, are kept as they are.
+    """
+    lines: List[str] = []
+    # Number of vertexes, texture vertexes, and vertex normals so far.
+    offsets = [0, 0, 0]
+    for fragment in fragments:
+        counts = [0, 0, 0]
+        for line in fragment.splitlines():
+            if line.startswith('v '):
+                counts[0] += 1
+            elif line.startswith('vt '):
+                counts[1] += 1
+            elif line.startswith('vn '):
+                counts[2] += 1
+            elif line.startswith(('f ', 'l ')) and any(offsets):
+                line = rebase_line(line, offsets)
+            lines.append(line)
+        offsets = [offset + count for offset, count in zip(offsets, counts)]
+    return join_lines(lines)
+
+
+def rebase_line(line: str, offsets: List[int]) -> str:
+    """
+    Add offsets to the vertex, texture vertex, and vertex normal
+    references of an f or l record.
+    """
+    keyword, *references = line.split()
+    return ' '.join([keyword] + [
+        '/'.join(_rebase_index(index, offset) for index, offset in zip(reference.split('/'), offsets))
+        for reference in references
+    ])
+
+
+def _rebase_index(index: str, offset: int) -> str:
+    # Empty indices, such as the texture vertex of f 1//1, are kept empty.
+    if not index or index.startswith('-'):
+        return index
+    return str(int(index) + offset)
@@ -0,0 +1,113 @@
+"""
+Module to detect shapes enclosed by other shapes, so they can be culled.
+
+A shape is enclosed if it lies strictly within the outer shell of a solid
+of another shape, such as a component inside a closed housing.
+Cavities within the occluding solid are treated as filled,
+as nothing inside them can be seen from outside either.
+
+Candidates are found by sweeping bounding boxes along the x axis,
+so only solids whose bounding box contains a shape's are considered.
+They are then confirmed by testing the vertexes of the enclosed shape
+against the outer shell, and checking it stays clear of the outer shell.
+The solid bounded by an outer shell is only built for such candidates.
+
+Shapes are expected to be in place, see get_shapes.
+"""
+import heapq
+from typing import Iterator, List, Optional, Set, Tuple
+
+import Part
+
+__all__ = ['get_enclosed_indices']
+
+# Distance below which shapes are considered touching.
+TOLERANCE = 1e-7
+
+
+def get_enclosed_indices(shapes: List[object]) -> Set[int]:
+    """
+    Return the indices of shapes enclosed by the outer shell
+    of a solid of another shape.
+    """
+    bound_boxes = [shape.BoundBox for shape in shapes]
+    solids = [
+        (index, solid, solid.BoundBox)
+        for index, shape in enumerate(shapes)
+        for solid in shape.Solids
+    ]
+    outer_solids = {}
+    enclosed = set()
+    for index, candidates in _get_candidates(bound_boxes, solids):
+        for solid_index in candidates:
+            occluder_index, solid, _ = solids[solid_index]
+            if occluder_index == index:
+                continue
+            if solid_index not in outer_solids:
+                outer_solids[solid_index] = _get_outer_solid(solid)
+            outer_solid = outer_solids[solid_index]
+            if outer_solid is not None and _is_enclosed(shapes[index], outer_solid):
+                enclosed.add(index)
+                break
+    return enclosed
+
+
+def _get_candidates(bound_boxes: List[object],
+                    solids: List[Tuple[int, object, object]]) -> Iterator[Tuple[int, List[int]]]:
+    """
+    Sweep bounding boxes along the x axis, yielding the index of each valid one
+    along with the indices of the solids whose bounding boxes contain it.
+    """
+    solid_order = sorted(range(len(solids)), key=lambda i: solids[i][2].XMin)
+    box_order = sorted(
+        (i for i, bound_box in enumerate(bound_boxes) if bound_box.isValid()),
+        key=lambda i: bound_boxes[i].XMin)
+    # Heap of solids starting before the current box, by where they end.
+    active = []
+    next_solid = 0
+    for index in box_order:
+        bound_box = bound_boxes[index]
+        while next_solid < len(solid_order) and solids[solid_order[next_solid]][2].XMin < bound_box.XMin:
+            solid_index = solid_order[next_solid]
+            heapq.heappush(active, (solids[solid_index][2].XMax, solid_index))
+            next_solid += 1
+        # Solids ending before this box starts cannot contain it, nor any box after it.
+        while active and active[0][0] <= bound_box.XMin:
+            heapq.heappop(active)
+        candidates = [
+            solid_index for _, solid_index in active
+            if _contains(solids[solid_index][2], bound_box)
+        ]
+        if candidates:
+            yield index, candidates
+
+
+def _get_outer_solid(solid) -> Optional[object]:
+    """
+    Solid bounded by the outer shell of a solid, or None if it is not closed.
+    """
+    outer_shell = solid.OuterShell
+    if not outer_shell.isClosed():
+        return None
+    return Part.Solid(outer_shell)
+
+
+def _contains(outer, inner) -> bool:
+    return (
+        outer.XMin < inner.XMin and inner.XMax < outer.XMax and
+        outer.YMin < inner.YMin and inner.YMax < outer.YMax and
+        outer.ZMin < inner.ZMin and inner.ZMax < outer.ZMax
+    )
+
+
+def _is_enclosed(shape, occluder) -> bool:
+    vertexes = shape.Vertexes
+    if not vertexes:
+        return False
+    # A shape clear of the shell lies entirely on one side of it,
+    # so testing its vertexes tells which side.
+    if not all(occluder.isInside(vertex.Point, TOLERANCE, False)
+               for vertex in vertexes):
+        return False
+    distance = occluder.Shells[0].distToShape(shape)[0]
+    return distance > TOLERANCE
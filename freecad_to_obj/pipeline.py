@@ -0,0 +1,68 @@
+"""
+Module to run the stages of an export concurrently.
+
+Each stage is an iterator run in its own thread, handing items
+to the next stage through a bounded queue, so a slow stage never lets
+the items of a fast stage pile up in memory.
+
+Threads share the global interpreter lock, so stages only overlap
+while one of them waits on I/O or runs code releasing the lock.
+"""
+import queue
+import threading
+from typing import Iterable, Iterator, TypeVar
+
+__all__ = ['iterate_in_thread']
+
+T = TypeVar('T')
+
+# Seconds between checks of whether a blocked stage should stop.
+POLL_INTERVAL = 0.1
+
+
+def iterate_in_thread(iterable: Iterable[T], queue_size: int = 8) -> Iterator[T]:
+    """
+    Iterate an iterable in a separate thread,
+    buffering at most queue_size items ahead of the caller.
+
+    Exceptions raised while iterating are raised to the caller.
+    If the caller stops early, the thread stops at the next item.
+    """
+    items: queue.Queue = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+
+    def produce() -> None:
+        try:
+            for item in iterable:
+                if not _put(items, (False, item), stop):
+                    return
+            _put(items, (True, None), stop)
+        except BaseException as exception:
+            _put(items, (True, exception), stop)
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            done, item = items.get()
+            if done:
+                if item is not None:
+                    raise item
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _put(items: queue.Queue, item: tuple, stop: threading.Event) -> bool:
+    """
+    Put an item once there is room, returning False if stopped first.
+    """
+    while not stop.is_set():
+        try:
+            items.put(item, timeout=POLL_INTERVAL)
+            return True
+        except queue.Full:
+            continue
+    return False
@@ -2,6 +2,8 @@ from typing import Callable, List
 
 from FreeCAD import Placement
 
+from .filters import CompiledFilter
+
 __all__ = ['resolve_objects']
 
 ASSEMBLY_TYPE_IDS = {'App::Part', 'App::Link'}
@@ -15,6 +17,9 @@ def resolve_objects(objects: List[object],
                     path: list = [],
                     parent_placement: Placement = None,
                     chain: bool = True) -> List[dict]:
+    if isinstance(ignore_object, CompiledFilter) and ignore_object.matches_depth(len(path)):
+        # Every object at this depth is ignored, so none is visited.
+        return []
     resolved = []
     for obj in objects:
         if not ignore_object(obj, path):
@@ -0,0 +1,53 @@
+"""
+Module to simplify polylines, such as discretized wires,
+by the Douglas-Peucker algorithm.
+
+Points within tolerance of the segment between the points kept around them
+are dropped. Distances to each segment are computed with NumPy.
+"""
+from typing import List, Sequence
+
+__all__ = ['simplify_polyline']
+
+
+def simplify_polyline(points: Sequence, tolerance: float) -> List[int]:
+    """
+    Return the indices of points to keep of a polyline,
+    always keeping its first and last point.
+    """
+    count = len(points)
+    if count < 3 or tolerance <= 0:
+        return list(range(count))
+    # Imported lazily, as NumPy is only needed when simplifying.
+    import numpy as np
+
+    array = np.array([(p[0], p[1], p[2]) for p in points], dtype=np.float64)
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    ranges = [(0, count - 1)]
+    while ranges:
+        start, end = ranges.pop()
+        if end - start < 2:
+            continue
+        distances = _get_distances_to_segment(
+            array[start + 1:end], array[start], array[end])
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            split = start + 1 + farthest
+            keep[split] = True
+            ranges.append((start, split))
+            ranges.append((split, end))
+    return np.flatnonzero(keep).tolist()
+
+
+def _get_distances_to_segment(points, start, end):
+    import numpy as np
+
+    direction = end - start
+    length_squared = direction.dot(direction)
+    if length_squared == 0:
+        # Segments closing a polyline start and end at the same point.
+        return np.linalg.norm(points - start, axis=1)
+    parameters = np.clip((points - start).dot(direction) / length_squared, 0, 1)
+    projections = start + parameters[:, np.newaxis] * direction
+    return np.linalg.norm(points - projections, axis=1)
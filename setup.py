@@ -23,6 +23,11 @@ setup(
     # Incude data files specified in MANIFEST.in file.
     include_package_data=True,
     install_requires=[],
+    entry_points={
+        'console_scripts': [
+            'freecad-to-obj-daemon=freecad_to_obj.daemon:main'
+        ]
+    },
     classifiers=[
         # Full List: https://pypi.org/pypi?%3Aaction=list_classifiers
         'License :: OSI Approved :: GNU Lesser General Public License v2 or later (LGPLv2+)',
@@ -0,0 +1,117 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+import FreeCAD as App
+from freecad_to_obj.daemon import DocumentCache, serve
+
+
+class DaemonTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.document_path = os.path.join(self.directory.name, 'Cube.FCStd')
+        document = App.newDocument('Cube')
+        box = document.addObject('Part::Box', 'Box')
+        box.Label = 'Cube'
+        document.recompute()
+        document.saveAs(self.document_path)
+        App.closeDocument(document.Name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_serve(self):
+        jobs = [
+            {'id': 1, 'path': self.document_path, 'objects': ['Box']},
+            {'id': 2, 'path': self.document_path},
+            {'id': 3, 'path': self.document_path, 'objects': ['Sphere']}
+        ]
+        input_stream = io.StringIO(''.join(json.dumps(job) + '\n' for job in jobs))
+        output_stream = io.StringIO()
+        cache = DocumentCache()
+        with open(os.path.join(os.path.dirname(__file__), 'cube.obj')) as f:
+            expected = f.read()
+
+        serve(input_stream, output_stream, cache)
+
+        results = [json.loads(line) for line in output_stream.getvalue().splitlines()]
+        self.assertEqual(results[0], {'id': 1, 'obj': expected})
+        self.assertEqual(results[1], {'id': 2, 'obj': expected})
+        self.assertEqual(results[2], {
+            'id': 3,
+            'error': f'No object named Sphere in {self.document_path}.'
+        })
+        self.assertEqual(len(cache), 1)
+
+    def test_serve_with_invalid_json(self):
+        output_stream = io.StringIO()
+
+        serve(io.StringIO('{\n'), output_stream, DocumentCache())
+
+        result = json.loads(output_stream.getvalue())
+        self.assertIsNone(result['id'])
+        self.assertIn('error', result)
+
+    def test_document_cache_with_linked_document(self):
+        base_path, assembly_path = self._save_assembly()
+        cache = DocumentCache(size=1)
+
+        assembly = cache.get(assembly_path)
+
+        self.assertIn('Base', App.listDocuments())
+        self.assertIs(cache.get(assembly_path), assembly)
+
+        cache.get(self.document_path)
+
+        self.assertNotIn('Assembly', App.listDocuments())
+        self.assertNotIn('Base', App.listDocuments())
+
+    def test_document_cache_with_changed_linked_document(self):
+        base_path, assembly_path = self._save_assembly()
+        cache = DocumentCache()
+        assembly = cache.get(assembly_path)
+        mtime = os.path.getmtime(base_path) + 10
+        os.utime(base_path, (mtime, mtime))
+
+        reopened = cache.get(assembly_path)
+
+        self.assertIsNot(reopened, assembly)
+        self.assertEqual(len(cache), 1)
+        self.assertIn('Base', App.listDocuments())
+
+    def test_document_cache_with_changed_linked_document_already_open(self):
+        base_path, assembly_path = self._save_assembly()
+        _, other_assembly_path = self._save_assembly('OtherAssembly')
+        cache = DocumentCache()
+        cache.get(assembly_path)
+        base = App.getDocument('Base')
+        mtime = os.path.getmtime(base_path) + 10
+        os.utime(base_path, (mtime, mtime))
+
+        cache.get(other_assembly_path)
+
+        self.assertIsNot(App.getDocument('Base'), base)
+        self.assertEqual(len(cache), 1)
+
+    def _save_assembly(self, assembly_name='Assembly'):
+        base_path = os.path.join(self.directory.name, 'Base.FCStd')
+        assembly_path = os.path.join(self.directory.name, f'{assembly_name}.FCStd')
+        base = App.newDocument('Base')
+        box = base.addObject('Part::Box', 'Box')
+        base.recompute()
+        base.saveAs(base_path)
+        assembly = App.newDocument(assembly_name)
+        link = assembly.addObject('App::Link', 'Link')
+        link.LinkedObject = box
+        assembly.recompute()
+        assembly.saveAs(assembly_path)
+        App.closeDocument(assembly.Name)
+        App.closeDocument(base.Name)
+        return base_path, assembly_path
+
+
+if __name__ == '__main__':
+    unittest.main()
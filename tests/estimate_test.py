@@ -0,0 +1,52 @@
+import unittest
+
+import FreeCAD as App
+import freecad_to_obj
+
+
+class EstimateTest(unittest.TestCase):
+
+    def test_estimate_with_cube(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Box')
+        box.Label = 'Cube'
+        document.recompute()
+
+        estimate = freecad_to_obj.estimate([box])
+
+        self.assertEqual(estimate['triangles'], 12)
+        self.assertEqual(estimate['wire_points'], 30)
+        self.assertGreater(estimate['bytes'], 0)
+        self.assertGreater(estimate['seconds'], 0)
+        self.assertEqual(len(estimate['objects']), 1)
+        self.assertEqual(estimate['objects'][0]['name'], 'Cube')
+        self.assertEqual(estimate['objects'][0]['triangles'], 12)
+
+    def test_estimate_with_sphere_scales_with_mesh_settings(self):
+        document = App.newDocument()
+        sphere = document.addObject('Part::Sphere', 'Sphere')
+        document.recompute()
+
+        coarse = freecad_to_obj.estimate([sphere])
+        fine = freecad_to_obj.estimate([sphere], mesh_settings={
+            'LinearDeflection': 0.01,
+            'AngularDeflection': 0.1,
+            'Relative': True
+        })
+
+        self.assertGreater(fine['triangles'], coarse['triangles'])
+
+    def test_estimate_with_invisible_object(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Box')
+        box.Visibility = False
+        document.recompute()
+
+        estimate = freecad_to_obj.estimate([box])
+
+        self.assertEqual(estimate['triangles'], 0)
+        self.assertEqual(estimate['objects'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+
+import FreeCAD as App
+import freecad_to_obj
+import numpy as np
+
+
+class ExportArraysTest(unittest.TestCase):
+
+    def test_export_arrays_with_cube(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Box')
+        box.Label = 'Cube'
+        document.recompute()
+
+        arrays = freecad_to_obj.export_arrays([box])
+
+        self.assertEqual(len(arrays), 1)
+        cube = arrays[0]
+        self.assertEqual(cube['name'], 'Cube')
+        self.assertEqual(cube['label'], 'Cube')
+        self.assertEqual(cube['path'], [])
+        self.assertEqual(cube['vertices'].shape, (8, 3))
+        self.assertEqual(cube['vertices'].dtype, np.float64)
+        self.assertEqual(cube['normals'].shape, (12, 3))
+        self.assertEqual(cube['faces'].shape, (12, 3))
+        self.assertEqual(cube['faces'].dtype, np.int32)
+        self.assertEqual(cube['faces'].max(), 7)
+        self.assertEqual(len(cube['wires']), 6)
+        for wire in cube['wires']:
+            self.assertEqual(wire.shape, (5, 3))
+        np.testing.assert_array_equal(cube['vertices'].min(axis=0), [0, 0, 0])
+        np.testing.assert_array_equal(cube['vertices'].max(axis=0), [10, 10, 10])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+import FreeCAD as App
+import freecad_to_obj
+from FreeCAD import Placement, Rotation, Vector
+
+
+class ExportBatchesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.document = App.newDocument()
+        self.boxes = []
+        for i in range(3):
+            box = self.document.addObject('Part::Box', f'Box{i}')
+            box.Label = f'Cube{i}'
+            box.Placement = Placement(
+                Vector(20 * i, 0, 0), Rotation(Vector(0, 0, 1), 0))
+            self.boxes.append(box)
+        self.document.recompute()
+
+    def test_export_batches_with_small_objects(self):
+        obj_file_contents, index = freecad_to_obj.export_batches(self.boxes)
+
+        lines = obj_file_contents.splitlines()
+        object_lines = [line for line in lines if line.startswith('o ')]
+        self.assertEqual(object_lines, ['o Batch0', 'o Batch0Wire'])
+        self.assertEqual(len([line for line in lines if line.startswith('f ')]), 36)
+        self.assertEqual(len([line for line in lines if line.startswith('l ')]), 18)
+        self.assertEqual([entry['name'] for entry in index], ['Cube0', 'Cube1', 'Cube2'])
+        self.assertEqual([entry['object'] for entry in index], ['Batch0'] * 3)
+        self.assertEqual([entry['vertices'] for entry in index], [[1, 9], [9, 17], [17, 25]])
+        self.assertEqual([entry['faces'] for entry in index], [[0, 12], [12, 24], [24, 36]])
+        self.assertEqual([entry['wires'] for entry in index], [[0, 6], [6, 12], [12, 18]])
+
+    def test_export_batches_with_batch_cell_size(self):
+        obj_file_contents, index = freecad_to_obj.export_batches(
+            self.boxes, batch_cell_size=35)
+
+        self.assertEqual([entry['object'] for entry in index], ['Batch0', 'Batch0', 'Cube2'])
+
+    def test_export_batches_with_triangle_threshold(self):
+        obj_file_contents, index = freecad_to_obj.export_batches(
+            self.boxes, triangle_threshold=12)
+
+        self.assertEqual(obj_file_contents, freecad_to_obj.export(self.boxes))
+        self.assertEqual([entry['object'] for entry in index], ['Cube0', 'Cube1', 'Cube2'])
+
+    def test_export_batches_with_tessellation_fallbacks(self):
+        obj_file_contents, index = freecad_to_obj.export_batches(
+            self.boxes[:2], tessellation_timeout=0)
+
+        lines = obj_file_contents.splitlines()
+        self.assertEqual(lines[0], (
+            '# Batch0: '
+            'Cube0: tessellation exceeded 0 seconds, exported as bounding box. '
+            'Cube1: tessellation exceeded 0 seconds, exported as bounding box.'))
+        self.assertEqual(lines[1], 'o Batch0')
+
+    def test_export_batches_with_batch_key_and_batch_cell_size_raises_value_error(self):
+        with self.assertRaises(ValueError) as cm:
+            freecad_to_obj.export_batches(
+                self.boxes, batch_key=lambda obj, path, shape_index: 0, batch_cell_size=10)
+
+        self.assertEqual(str(cm.exception),
+                         'Only one of batch_key or batch_cell_size may be given.')
+
+
+if __name__ == '__main__':
+    unittest.main()
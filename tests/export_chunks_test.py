@@ -0,0 +1,48 @@
+import json
+import os
+import tempfile
+import unittest
+
+import FreeCAD as App
+import freecad_to_obj
+from FreeCAD import Placement, Rotation, Vector
+
+
+class ExportChunksTest(unittest.TestCase):
+
+    def test_export_chunks(self):
+        document = App.newDocument()
+        boxes = []
+        for name, x in [('Box', 0), ('MovedBox', 100)]:
+            box = document.addObject('Part::Box', name)
+            box.Label = name
+            box.Placement = Placement(Vector(x, 0, 0), Rotation())
+            boxes.append(box)
+        cylinder = document.addObject('Part::Cylinder', 'Cylinder')
+        cylinder.Label = 'Cylinder'
+        document.recompute()
+
+        with tempfile.TemporaryDirectory() as directory:
+            scene_path = os.path.join(directory, 'scene.json')
+            scene = freecad_to_obj.export_chunks(
+                boxes + [cylinder], directory, scene_path=scene_path)
+            rerun_scene = freecad_to_obj.export_chunks(boxes, directory)
+
+            with open(scene_path) as f:
+                self.assertEqual(json.load(f), scene)
+            box, moved_box, cylinder_object = scene['objects']
+            with open(os.path.join(directory, box['chunk'] + '.obj')) as f:
+                chunk = f.read()
+
+        self.assertEqual([o['name'] for o in scene['objects']], ['Box', 'MovedBox', 'Cylinder'])
+        self.assertEqual(box['chunk'], moved_box['chunk'])
+        self.assertNotEqual(box['chunk'], cylinder_object['chunk'])
+        self.assertEqual(sorted(scene['chunks']), sorted({box['chunk'], cylinder_object['chunk']}))
+        self.assertEqual(moved_box['placement'][3], 100)
+        self.assertEqual(rerun_scene['chunks'], [])
+        self.assertTrue(chunk.startswith('o Chunk\n'))
+        self.assertIn('f 1//1 2//1 3//1', chunk)
+
+
+if __name__ == '__main__':
+    unittest.main()
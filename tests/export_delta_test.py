@@ -0,0 +1,101 @@
+import importlib
+import json
+import unittest
+from unittest.mock import patch
+
+import FreeCAD as App
+import freecad_to_obj
+from FreeCAD import Placement, Rotation, Vector
+
+export_delta_module = importlib.import_module('freecad_to_obj.export_delta')
+
+
+class ExportDeltaTest(unittest.TestCase):
+
+    def setUp(self):
+        self.document = App.newDocument()
+        self.box = self.document.addObject('Part::Box', 'Box')
+        self.box.Label = 'Cube'
+        self.cylinder = self.document.addObject('Part::Cylinder', 'Cylinder')
+        self.cylinder.Label = 'Cylinder'
+        self.document.recompute()
+
+    def test_export_delta_without_previous_fingerprints(self):
+        delta = freecad_to_obj.export_delta([self.box, self.cylinder])
+
+        lines = delta['obj'].splitlines()
+        self.assertIn('o Cube', lines)
+        self.assertIn('o Cylinder', lines)
+        self.assertEqual(delta['removed'], [])
+        self.assertEqual(delta['transforms'], [])
+        self.assertEqual(len(delta['fingerprints']), 2)
+
+    def test_export_delta_without_changes(self):
+        previous = freecad_to_obj.export_delta([self.box, self.cylinder])
+        # Fingerprints survive a round trip through JSON.
+        fingerprints = json.loads(json.dumps(previous['fingerprints']))
+
+        delta = freecad_to_obj.export_delta(
+            [self.box, self.cylinder], previous_fingerprints=fingerprints)
+
+        self.assertEqual(delta['obj'], '')
+        self.assertEqual(delta['removed'], [])
+        self.assertEqual(delta['transforms'], [])
+
+    def test_export_delta_with_moved_changed_and_removed_objects(self):
+        previous = freecad_to_obj.export_delta([self.box, self.cylinder])
+        self.box.Placement = Placement(
+            Vector(5, 0, 0), Rotation(Vector(0, 0, 1), 0))
+        self.cylinder.Height = 20
+        self.document.recompute()
+
+        delta = freecad_to_obj.export_delta(
+            [self.box], previous_fingerprints=previous['fingerprints'])
+        moved = freecad_to_obj.export_delta(
+            [self.box, self.cylinder], previous_fingerprints=previous['fingerprints'])
+
+        self.assertEqual(delta['obj'], '')
+        self.assertEqual(delta['removed'], ['Cylinder'])
+        self.assertEqual(len(delta['transforms']), 1)
+        transform = delta['transforms'][0]
+        self.assertEqual(transform['name'], 'Cube')
+        self.assertEqual(transform['transform'], [
+            1, 0, 0, 5,
+            0, 1, 0, 0,
+            0, 0, 1, 0,
+            0, 0, 0, 1
+        ])
+        lines = moved['obj'].splitlines()
+        self.assertNotIn('o Cube', lines)
+        self.assertIn('o Cylinder', lines)
+
+    def test_export_delta_with_renamed_object(self):
+        previous = freecad_to_obj.export_delta([self.box, self.cylinder])
+        self.box.Label = 'Box'
+
+        delta = freecad_to_obj.export_delta(
+            [self.box, self.cylinder], previous_fingerprints=previous['fingerprints'])
+
+        lines = delta['obj'].splitlines()
+        self.assertIn('o Box', lines)
+        self.assertNotIn('o Cylinder', lines)
+        self.assertEqual(delta['removed'], ['Cube'])
+        self.assertEqual(delta['transforms'], [])
+
+    def test_export_delta_with_object_resolved_twice(self):
+        with patch.object(export_delta_module, 'get_shape_hash',
+                          wraps=export_delta_module.get_shape_hash) as get_shape_hash:
+            previous = freecad_to_obj.export_delta([self.box, self.box])
+
+        self.assertEqual(len(previous['fingerprints']), 2)
+        self.assertEqual(get_shape_hash.call_count, 1)
+
+        delta = freecad_to_obj.export_delta(
+            [self.box], previous_fingerprints=previous['fingerprints'])
+
+        self.assertEqual(delta['obj'], '')
+        self.assertEqual(delta['removed'], ['Cube'])
+
+
+if __name__ == '__main__':
+    unittest.main()
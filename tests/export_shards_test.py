@@ -0,0 +1,58 @@
+import os
+import unittest
+
+import FreeCAD as App
+import freecad_to_obj
+
+
+class ExportShardsTest(unittest.TestCase):
+
+    def setUp(self):
+        document = App.newDocument()
+        self.boxes = []
+        for name in ['Box', 'OtherBox']:
+            box = document.addObject('Part::Box', name)
+            box.Label = 'Cube'
+            self.boxes.append(box)
+        document.recompute()
+        with open(os.path.join(os.path.dirname(__file__), 'cube.obj')) as f:
+            self.cube = f.read()
+
+    def test_export_shards_by_top_level_object(self):
+        shards = freecad_to_obj.export_shards(self.boxes)
+
+        self.assertEqual(shards, [self.cube, self.cube])
+
+    def test_export_shards_with_shard_key(self):
+        shards = freecad_to_obj.export_shards(
+            self.boxes, shard_key=lambda obj, path, shape_index: 'all')
+
+        self.assertEqual(shards, [freecad_to_obj.export(self.boxes)])
+
+    def test_export_shards_with_shard_size(self):
+        shards = freecad_to_obj.export_shards(self.boxes, shard_size=1)
+
+        self.assertEqual(shards, [self.cube, self.cube])
+
+    def test_export_shards_with_shard_size_in_bytes(self):
+        for box in self.boxes:
+            box.Label = 'Würfel'
+        size = len(freecad_to_obj.export(self.boxes[:1]).encode('utf-8'))
+
+        shards = freecad_to_obj.export_shards(self.boxes, shard_size=2 * size - 1)
+
+        self.assertEqual(len(shards), 2)
+
+    def test_export_shards_with_shard_key_and_shard_size_raises_value_error(self):
+        with self.assertRaises(ValueError) as cm:
+            freecad_to_obj.export_shards(
+                self.boxes,
+                shard_key=lambda obj, path, shape_index: 'all',
+                shard_size=1)
+
+        self.assertEqual(str(cm.exception),
+                         'Only one of shard_key or shard_size may be given.')
+
+
+if __name__ == '__main__':
+    unittest.main()
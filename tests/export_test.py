@@ -2,12 +2,15 @@ import os
 import unittest
 from pathlib import Path
 from typing import List
+from unittest.mock import patch
 
 import FreeCAD as App
 import freecad_to_obj
+import MeshPart
 import Part
 import Sketcher
 from FreeCAD import Placement, Rotation, Vector
+from freecad_to_obj.export import TESSELLATION_BACKENDS, default_mesh_settings
 
 
 class ExportTest(unittest.TestCase):
@@ -412,6 +415,26 @@ class ExportTest(unittest.TestCase):
         part_document_path.unlink()
         part_link_document_path.unlink()
 
+    def test_export_with_translated_part_containing_translated_primitive_without_copying_shapes(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Box')
+        box.Label = 'Cube'
+        box.Placement = Placement(
+            Vector(5, 0, 0), Rotation(Vector(0, 0, 1), 0))
+
+        part = document.addObject('App::Part', 'Part')
+        part.addObject(box)
+        part.Placement = Placement(
+            Vector(5, 0, 0), Rotation(Vector(0, 0, 1), 0))
+        document.recompute()
+
+        with open(os.path.join(os.path.dirname(__file__), 'translated_cube.obj')) as f:
+            expected = f.read()
+
+        obj_file_contents = freecad_to_obj.export([part], copy_shapes=False)
+
+        self.assertEqual(obj_file_contents, expected)
+
     def test_export_with_keep_unresolved_part_containing_primitive(self):
         document = App.newDocument()
         box = document.addObject('Part::Box', 'Box')
@@ -539,6 +562,17 @@ class ExportTest(unittest.TestCase):
 
         self.assertEqual(obj_file_contents, '')
 
+    def test_export_with_do_not_export_filter_specification(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Cube')
+        box.Label = 'Cube'
+        document.recompute()
+
+        obj_file_contents = freecad_to_obj.export(
+            [box], do_not_export={'type_ids': {'Part::Box'}})
+
+        self.assertEqual(obj_file_contents, '')
+
     def test_export_with_invisible_object(self):
         document = App.newDocument()
         box = document.addObject('Part::Box', 'Cube')
@@ -550,6 +584,361 @@ class ExportTest(unittest.TestCase):
 
         self.assertEqual(obj_file_contents, '')
 
+    def test_export_with_preview(self):
+        document = App.newDocument()
+        sphere = document.addObject('Part::Sphere', 'Sphere')
+        sphere.Label = 'Sphere'
+        sphere.Placement = Placement(
+            Vector(10, 0, 0), Rotation(Vector(0, 0, 1), 0))
+        document.recompute()
+
+        obj_file_contents = freecad_to_obj.export([sphere], preview=True)
+
+        lines = obj_file_contents.splitlines()
+        object_lines = [line for line in lines if line.startswith('o ')]
+        vertex_lines = [line for line in lines if line.startswith('v ')]
+        normal_lines = [line for line in lines if line.startswith('vn ')]
+        face_lines = [line for line in lines if line.startswith('f ')]
+        self.assertEqual(object_lines, ['o Sphere'])
+        self.assertEqual(len(vertex_lines), 8)
+        self.assertEqual(len(normal_lines), 12)
+        self.assertEqual(len(face_lines), 12)
+        self.assertEqual(vertex_lines[0], 'v 5.0 -5.0 -5.0')
+        self.assertEqual(vertex_lines[-1], 'v 15.0 5.0 5.0')
+
+    def test_export_with_tessellation_timeout(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Box')
+        box.Label = 'Cube'
+        document.recompute()
+        with open(os.path.join(os.path.dirname(__file__), 'cube.obj')) as f:
+            expected = f.read()
+
+        obj_file_contents = freecad_to_obj.export(
+            [box], tessellation_timeout=60)
+
+        self.assertEqual(obj_file_contents, expected)
+
+    def test_export_with_exceeded_tessellation_timeout(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Box')
+        box.Label = 'Cube'
+        document.recompute()
+
+        obj_file_contents = freecad_to_obj.export(
+            [box], tessellation_timeout=0)
+
+        lines = obj_file_contents.splitlines()
+        self.assertEqual(
+            lines[0], '# Cube: tessellation exceeded 0 seconds, exported as bounding box.')
+        self.assertEqual(lines[1], 'o Cube')
+        self.assertNotIn('o CubeWire0', lines)
+
+    def test_export_with_tessellation_timeout_without_fork_raises_value_error(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Box')
+        document.recompute()
+
+        with patch('multiprocessing.get_all_start_methods', return_value=['spawn']):
+            with self.assertRaises(ValueError) as cm:
+                freecad_to_obj.export([box], tessellation_timeout=60)
+
+        self.assertEqual(str(cm.exception),
+                         'tessellation_timeout requires forking worker processes, '
+                         'which this platform does not support.')
+
+    def test_export_with_failing_tessellation_and_timeout(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Box')
+        box.Label = 'Cube'
+        document.recompute()
+
+        def fail(shape, mesh_settings, segments=False):
+            raise ValueError('mesher failed')
+
+        with patch.dict(TESSELLATION_BACKENDS, {'standard': fail}):
+            obj_file_contents = freecad_to_obj.export(
+                [box], tessellation_timeout=60)
+
+        lines = obj_file_contents.splitlines()
+        self.assertEqual(
+            lines[0],
+            "# Cube: tessellation failed with ValueError('mesher failed'), exported as bounding box.")
+        self.assertEqual(lines[1], 'o Cube')
+
+    def test_export_with_triangulation_wire_mode(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Box')
+        box.Label = 'Cube'
+        document.recompute()
+
+        obj_file_contents = freecad_to_obj.export(
+            [box], wire_mode='triangulation')
+
+        lines = obj_file_contents.splitlines()
+        vertex_lines = [line for line in lines if line.startswith('v ')]
+        wire_lines = [line for line in lines if line.startswith('l ')]
+        self.assertEqual(len(vertex_lines), 8)
+        self.assertEqual(len(wire_lines), 6)
+        for wire_line in wire_lines:
+            indices = [int(index) for index in wire_line.split()[1:]]
+            self.assertEqual(len(indices), 5)
+            self.assertEqual(indices[0], indices[-1])
+            self.assertTrue(all(1 <= index <= 8 for index in indices))
+
+    def test_export_with_invalid_wire_mode_raises_value_error(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Box')
+        document.recompute()
+
+        with self.assertRaises(ValueError) as cm:
+            freecad_to_obj.export([box], wire_mode='edges')
+
+        self.assertEqual(str(cm.exception),
+                         'wire_mode must be one of: discretize, triangulation.')
+
+    def test_export_with_tessellate_backend(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Box')
+        box.Label = 'Cube'
+        document.recompute()
+
+        obj_file_contents = freecad_to_obj.export(
+            [box], tessellation_backend='tessellate')
+
+        lines = obj_file_contents.splitlines()
+        face_lines = [line for line in lines if line.startswith('f ')]
+        self.assertEqual(len(face_lines), 12)
+        self.assertIn('o CubeWire5', lines)
+
+    def test_export_with_tessellation_backend_per_object(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Box')
+        sphere = document.addObject('Part::Sphere', 'Sphere')
+        document.recompute()
+        backends = []
+
+        def get_backend(obj, path, shape_index):
+            backends.append(obj.Name)
+            return 'tessellate' if obj.Name == 'Box' else 'standard'
+
+        freecad_to_obj.export(
+            [box, sphere], tessellation_backend=get_backend)
+
+        self.assertEqual(backends, ['Box', 'Sphere'])
+
+    def test_export_with_invalid_tessellation_backend_raises_value_error(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Box')
+        document.recompute()
+
+        with self.assertRaises(ValueError) as cm:
+            freecad_to_obj.export([box], tessellation_backend='gmsh')
+
+        self.assertEqual(str(cm.exception),
+                         'tessellation_backend must be one of: standard, mefisto, netgen, tessellate.')
+
+    def test_export_forwards_mesh_settings_to_standard_backend(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Box')
+        document.recompute()
+
+        with patch('MeshPart.meshFromShape', wraps=MeshPart.meshFromShape) as mesh_from_shape:
+            freecad_to_obj.export([box], mesh_settings={'MaxLength': 5})
+
+        self.assertEqual(mesh_from_shape.call_args.kwargs['MaxLength'], 5)
+
+    def test_export_with_mesh_settings_not_accepted_by_backend_raises_value_error(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Box')
+        document.recompute()
+
+        with self.assertRaises(ValueError) as cm:
+            freecad_to_obj.export(
+                [box], mesh_settings={'MaxLength': 5}, tessellation_backend='tessellate')
+
+        self.assertEqual(str(cm.exception),
+                         'mesh_settings MaxLength not accepted by tessellation_backend tessellate, '
+                         'which accepts: LinearDeflection, Relative.')
+
+    def test_export_with_mesh_settings_per_backend(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Box')
+        cylinder = document.addObject('Part::Cylinder', 'Cylinder')
+        document.recompute()
+
+        def get_backend(obj, path, shape_index):
+            return 'tessellate' if obj.Name == 'Box' else 'standard'
+
+        with patch('MeshPart.meshFromShape', wraps=MeshPart.meshFromShape) as mesh_from_shape:
+            obj_file_contents = freecad_to_obj.export(
+                [box, cylinder],
+                tessellation_backend=get_backend,
+                mesh_settings={
+                    'standard': {'MaxLength': 5},
+                    'tessellate': {'LinearDeflection': 0.5}
+                })
+
+        self.assertEqual(mesh_from_shape.call_count, 1)
+        self.assertEqual(mesh_from_shape.call_args.kwargs['MaxLength'], 5)
+        self.assertIn('o Box', obj_file_contents.splitlines())
+
+    def test_export_with_copy_of_default_mesh_settings(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Box')
+        document.recompute()
+
+        obj_file_contents = freecad_to_obj.export(
+            [box], mesh_settings=dict(default_mesh_settings), tessellation_backend='tessellate')
+
+        self.assertEqual(obj_file_contents,
+                         freecad_to_obj.export([box], tessellation_backend='tessellate'))
+
+    def test_export_with_refine(self):
+        document = App.newDocument()
+        box = Part.makeBox(10, 10, 10)
+        adjacent_box = Part.makeBox(10, 10, 10, Vector(10, 0, 0))
+        fused = document.addObject('Part::Feature', 'Fused')
+        fused.Shape = box.fuse(adjacent_box)
+        fused.Label = 'Fused'
+        document.recompute()
+
+        unrefined = freecad_to_obj.export([fused]).splitlines()
+        refined = freecad_to_obj.export([fused], refine=True).splitlines()
+
+        def count_wires(lines):
+            return len([line for line in lines if line.startswith('o FusedWire')])
+
+        self.assertEqual(count_wires(unrefined), 10)
+        self.assertEqual(count_wires(refined), 6)
+
+    def test_export_with_refine_and_placement(self):
+        document = App.newDocument()
+        fused = document.addObject('Part::Feature', 'Fused')
+        fused.Shape = Part.makeBox(10, 10, 10).fuse(Part.makeBox(10, 10, 10, Vector(10, 0, 0)))
+        fused.Placement = Placement(Vector(100, 0, 0), Rotation())
+        document.recompute()
+
+        lines = freecad_to_obj.export([fused], refine=True).splitlines()
+
+        xs = [float(line.split()[1]) for line in lines if line.startswith('v ')]
+        self.assertAlmostEqual(min(xs), 100)
+        self.assertAlmostEqual(max(xs), 120)
+
+    def test_export_with_offsets(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Box')
+        box.Label = 'Cube'
+        document.recompute()
+
+        obj_file_contents, offsetv, offsetvn = freecad_to_obj.export(
+            [box], offsetv=9, offsetvn=13, return_offsets=True)
+
+        lines = obj_file_contents.splitlines()
+        face_lines = [line for line in lines if line.startswith('f ')]
+        self.assertEqual(face_lines[0].split()[1].split('//')[1], '13')
+        self.assertEqual(offsetvn, 13 + 12)
+        vertex_count = len([line for line in lines if line.startswith('v ')])
+        self.assertEqual(offsetv, 9 + vertex_count)
+        self.assertTrue(all(
+            9 <= int(index) < offsetv
+            for line in lines if line.startswith('l ')
+            for index in line.split()[1:]))
+
+    def test_export_with_resolved_slice(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Box')
+        box.Label = 'Cube'
+        cylinder = document.addObject('Part::Cylinder', 'Cylinder')
+        cylinder.Label = 'Cylinder'
+        document.recompute()
+
+        first = freecad_to_obj.export([box, cylinder], resolved_slice=slice(0, 1))
+        second = freecad_to_obj.export([box, cylinder], resolved_slice=slice(1, None))
+
+        self.assertEqual(first, freecad_to_obj.export([box]))
+        self.assertEqual(second, freecad_to_obj.export([cylinder]))
+        self.assertEqual(freecad_to_obj.merge([first, second]),
+                         freecad_to_obj.export([box, cylinder]))
+
+    def test_export_with_wire_simplification(self):
+        document = App.newDocument()
+        cylinder = document.addObject('Part::Cylinder', 'Cylinder')
+        document.recompute()
+
+        def count_vertices(obj_file_contents):
+            return len([line for line in obj_file_contents.splitlines() if line.startswith('v ')])
+
+        vertex_count = count_vertices(freecad_to_obj.export([cylinder]))
+        simplified_vertex_count = count_vertices(freecad_to_obj.export(
+            [cylinder], wire_simplification={'Tolerance': 0.01, 'Relative': True}))
+
+        self.assertLess(simplified_vertex_count, vertex_count)
+
+    def test_export_with_merge_wires(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Box')
+        box.Label = 'Cube'
+        document.recompute()
+
+        obj_file_contents = freecad_to_obj.export([box], merge_wires=True)
+
+        lines = obj_file_contents.splitlines()
+        object_lines = [line for line in lines if line.startswith('o ')]
+        self.assertEqual(object_lines, ['o Cube', 'o CubeWire'])
+        self.assertEqual(len([line for line in lines if line.startswith('l ')]), 6)
+        wire_vertex_lines = lines[lines.index('o CubeWire'):]
+        self.assertEqual(len([line for line in wire_vertex_lines if line.startswith('v ')]), 30)
+
+    def test_export_with_sketch(self):
+        document = App.newDocument()
+        sketch = document.addObject('Sketcher::SketchObject', 'Sketch')
+        sketch.Label = 'Sketch'
+        sketch.addGeometry(Part.LineSegment(Vector(0, 0, 0), Vector(10, 0, 0)), False)
+        sketch.addGeometry(Part.LineSegment(Vector(10, 0, 0), Vector(10, 10, 0)), False)
+        sketch.addGeometry(Part.LineSegment(Vector(20, 0, 0), Vector(30, 0, 0)), False)
+        document.recompute()
+
+        obj_file_contents = freecad_to_obj.export([sketch])
+
+        lines = obj_file_contents.splitlines()
+        self.assertEqual(lines[0], 'o Sketch')
+        self.assertEqual(lines[1], 'o SketchWire0')
+        self.assertIn('o SketchWire1', lines)
+        self.assertNotIn('o SketchWire2', lines)
+        self.assertFalse(any(line.startswith('f ') for line in lines))
+
+    def test_export_with_reuse_triangulation(self):
+        document = App.newDocument()
+        cylinder = document.addObject('Part::Cylinder', 'Cylinder')
+        document.recompute()
+        # Attach a fine triangulation to the shape, as the GUI would.
+        cylinder.Shape.tessellate(0.001)
+        mesh_settings = {'LinearDeflection': 1, 'Relative': False}
+
+        def count_faces(obj_file_contents):
+            return len([line for line in obj_file_contents.splitlines() if line.startswith('f ')])
+
+        reused_face_count = count_faces(freecad_to_obj.export(
+            [cylinder], mesh_settings=mesh_settings,
+            tessellation_backend='tessellate', reuse_triangulation=True))
+        face_count = count_faces(freecad_to_obj.export(
+            [cylinder], mesh_settings=mesh_settings,
+            tessellation_backend='tessellate'))
+
+        self.assertGreater(reused_face_count, face_count)
+
+    def test_export_with_reuse_triangulation_and_other_backend_raises_value_error(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Box')
+        document.recompute()
+
+        with self.assertRaises(ValueError) as cm:
+            freecad_to_obj.export([box], reuse_triangulation=True)
+
+        self.assertEqual(str(cm.exception),
+                         'reuse_triangulation requires the tessellate tessellation_backend.')
+
 
 if __name__ == '__main__':
     unittest.main()
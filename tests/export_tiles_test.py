@@ -0,0 +1,42 @@
+import json
+import os
+import tempfile
+import unittest
+
+import FreeCAD as App
+import freecad_to_obj
+from FreeCAD import Placement, Rotation, Vector
+
+
+class ExportTilesTest(unittest.TestCase):
+
+    def test_export_tiles(self):
+        document = App.newDocument()
+        boxes = []
+        for name, x in [('Box', 0), ('FarBox', 100)]:
+            box = document.addObject('Part::Box', name)
+            box.Label = name
+            box.Placement = Placement(Vector(x, x, x), Rotation())
+            boxes.append(box)
+        document.recompute()
+
+        with tempfile.TemporaryDirectory() as directory:
+            index = freecad_to_obj.export_tiles(
+                boxes, directory, max_tile_objects=1)
+
+            with open(os.path.join(directory, 'tiles.json')) as f:
+                self.assertEqual(json.load(f), index)
+            self.assertEqual(index['bounds'], [0.0, 0.0, 0.0, 110.0, 110.0, 110.0])
+            self.assertEqual(len(index['tiles']), 2)
+            self.assertEqual(index['tiles'][0]['objects'], ['Box'])
+            self.assertEqual(index['tiles'][1]['objects'], ['FarBox'])
+            for tile in index['tiles']:
+                self.assertEqual(tile['depth'], 1)
+                tile_path = os.path.join(directory, tile['file'])
+                self.assertEqual(os.path.getsize(tile_path), tile['bytes'])
+                with open(tile_path) as f:
+                    self.assertIn('f 1//1 2//1 3//1', f.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import json
+import os
+import tempfile
+import unittest
+
+import FreeCAD as App
+import freecad_to_obj
+from FreeCAD import Placement, Rotation, Vector
+
+
+class ExportToFileTest(unittest.TestCase):
+
+    def test_export_to_file(self):
+        document = App.newDocument()
+        boxes = []
+        for name, x in [('Box', 0), ('FarBox', 100)]:
+            box = document.addObject('Part::Box', name)
+            box.Label = name
+            box.Placement = Placement(Vector(x, 0, 0), Rotation())
+            boxes.append(box)
+        document.recompute()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'boxes.obj')
+            manifest_path = os.path.join(directory, 'boxes.json')
+            manifest = freecad_to_obj.export_to_file(
+                boxes, path, manifest_path=manifest_path)
+
+            with open(manifest_path) as f:
+                self.assertEqual(json.load(f), manifest)
+            with open(path, 'rb') as f:
+                contents = f.read()
+
+        self.assertEqual(contents.decode('utf-8'), freecad_to_obj.export(boxes))
+        self.assertEqual(manifest['file'], 'boxes.obj')
+        self.assertEqual(manifest['bytes'], len(contents))
+        box, far_box = manifest['objects']
+        self.assertEqual(box['name'], 'Box')
+        self.assertEqual(box['offset'], 0)
+        self.assertEqual(far_box['offset'], box['length'])
+        self.assertTrue(contents[far_box['offset']:].startswith(b'o FarBox\n'))
+        self.assertEqual(box['normals'], [1, 13])
+        self.assertEqual(far_box['normals'], [13, 25])
+        self.assertEqual(box['vertices'][1], far_box['vertices'][0])
+        self.assertEqual(far_box['bounds'], [100.0, 0.0, 0.0, 110.0, 10.0, 10.0])
+
+    def test_export_to_file_pipelined(self):
+        document = App.newDocument()
+        boxes = []
+        for i in range(5):
+            box = document.addObject('Part::Box', f'Box{i}')
+            box.Placement = Placement(Vector(20 * i, 0, 0), Rotation())
+            boxes.append(box)
+        document.recompute()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'boxes.obj')
+            pipelined_path = os.path.join(directory, 'pipelined_boxes.obj')
+            manifest = freecad_to_obj.export_to_file(boxes, path)
+            pipelined_manifest = freecad_to_obj.export_to_file(
+                boxes, pipelined_path, pipelined=True, queue_size=1)
+
+            with open(path, 'rb') as f:
+                contents = f.read()
+            with open(pipelined_path, 'rb') as f:
+                pipelined_contents = f.read()
+
+        self.assertEqual(pipelined_contents, contents)
+        self.assertEqual(pipelined_manifest['objects'], manifest['objects'])
+
+    def test_export_to_file_pipelined_raises_value_error(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Box')
+        document.recompute()
+
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(ValueError) as cm:
+                freecad_to_obj.export_to_file(
+                    [box], os.path.join(directory, 'box.obj'),
+                    pipelined=True,
+                    object_name_getter=lambda obj, path, shape_index: None)
+
+        self.assertEqual(str(cm.exception), 'object_name_getter must return string.')
+
+    def test_export_to_file_pipelined_with_tessellation_timeout_raises_value_error(self):
+        document = App.newDocument()
+        box = document.addObject('Part::Box', 'Box')
+        document.recompute()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'box.obj')
+            with self.assertRaises(ValueError) as cm:
+                freecad_to_obj.export_to_file(
+                    [box], path, pipelined=True, tessellation_timeout=60)
+
+        self.assertEqual(str(cm.exception),
+                         'pipelined export cannot be combined with tessellation_timeout.')
+
+
+if __name__ == '__main__':
+    unittest.main()
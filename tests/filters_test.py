@@ -0,0 +1,108 @@
+import unittest
+
+from FreeCAD import Placement, Rotation, Vector
+from freecad_to_obj.filters import CompiledFilter, compile_filter
+from freecad_to_obj.resolve_objects import resolve_objects
+
+from tests.assembler import Assembler
+
+
+class FiltersTest(unittest.TestCase):
+
+    def test_compile_filter_with_type_ids(self):
+        part = (Assembler()
+                .part_containing(Placement(Vector(5, 0, 0), Rotation()))
+                .shape('Part::Box', 'Box', Placement(Vector(5, 0, 0), Rotation()))
+                .assemble())
+        ignore_object = compile_filter({'type_ids': {'Part::Box'}})
+
+        resolved_objects = resolve_objects(
+            [part], ignore_object=ignore_object)
+
+        self.assertEqual(len(resolved_objects), 0)
+
+    def test_compile_filter_with_labels(self):
+        part = (Assembler()
+                .part_containing(Placement(Vector(5, 0, 0), Rotation()))
+                .shape('Part::Box', 'Box', Placement(Vector(5, 0, 0), Rotation()))
+                .assemble())
+        part.Label = 'Subassembly'
+        keep_unresolved = compile_filter({'labels': ['Sub*']})
+
+        resolved_objects = resolve_objects([part], keep_unresolved)
+
+        self.assertEqual(len(resolved_objects), 1)
+        self.assertEqual(resolved_objects[0]['object'].TypeId, 'App::Part')
+
+    def test_compile_filter_with_invisible(self):
+        shape = (Assembler()
+                 .shape('Part::Box', 'Box', Placement(Vector(10, 0, 0), Rotation()))
+                 .assemble())
+        shape.Visibility = False
+        ignore_object = compile_filter({'invisible': True})
+
+        resolved_objects = resolve_objects(
+            [shape], ignore_object=ignore_object)
+
+        self.assertEqual(len(resolved_objects), 0)
+
+    def test_compile_filter_with_min_depth(self):
+        part = (Assembler()
+                .part_containing(Placement(Vector(5, 0, 0), Rotation()))
+                .part_containing(Placement(Vector(5, 0, 0), Rotation()))
+                .shape('Part::Box', 'Box', Placement(Vector(5, 0, 0), Rotation()))
+                .assemble())
+        keep_unresolved = compile_filter({'min_depth': 1})
+
+        resolved_objects = resolve_objects([part], keep_unresolved)
+
+        self.assertEqual(len(resolved_objects), 1)
+        self.assertEqual(len(resolved_objects[0]['path']), 1)
+        self.assertEqual(resolved_objects[0]['object'].TypeId, 'App::Part')
+
+    def test_compile_filter_with_min_depth_prunes_children(self):
+        part = (Assembler()
+                .part_containing(Placement(Vector(5, 0, 0), Rotation()))
+                .shape('Part::Box', 'Box', Placement(Vector(5, 0, 0), Rotation()))
+                .assemble())
+        visited = []
+
+        class RecordingFilter(CompiledFilter):
+            def __call__(self, obj, path):
+                visited.append(obj)
+                return super().__call__(obj, path)
+
+        resolved_objects = resolve_objects(
+            [part], ignore_object=RecordingFilter({'min_depth': 1}))
+
+        self.assertEqual(resolved_objects, [])
+        self.assertEqual(visited, [part])
+
+    def test_compile_filter_after_label_change(self):
+        shape = (Assembler()
+                 .shape('Part::Box', 'Box', Placement(Vector(10, 0, 0), Rotation()))
+                 .assemble())
+        shape.Label = 'Fastener'
+        ignore_object = compile_filter({'labels': ['Fastener*']})
+        self.assertTrue(ignore_object(shape, []))
+
+        shape.Label = 'Bracket'
+
+        self.assertFalse(ignore_object(shape, []))
+
+    def test_compile_filter_with_string_type_ids_raises_value_error(self):
+        with self.assertRaises(ValueError) as cm:
+            compile_filter({'type_ids': 'Part::Feature'})
+
+        self.assertEqual(str(cm.exception),
+                         'type_ids must be a collection of strings, not a string.')
+
+    def test_compile_filter_with_unknown_key_raises_value_error(self):
+        with self.assertRaises(ValueError) as cm:
+            compile_filter({'typeids': {'Part::Box'}})
+
+        self.assertEqual(str(cm.exception), 'Unknown filter keys: typeids.')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,21 @@
+import subprocess
+import sys
+import unittest
+
+
+class ImportTest(unittest.TestCase):
+
+    def test_import_does_not_import_workbenches(self):
+        script = (
+            'import sys\n'
+            'import freecad_to_obj\n'
+            'print(sorted({"Draft", "MeshPart"} & set(sys.modules)))\n'
+        )
+
+        output = subprocess.check_output([sys.executable, '-c', script])
+
+        self.assertEqual(output.decode().strip().splitlines()[-1], '[]')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+
+import FreeCAD as App
+import freecad_to_obj
+from FreeCAD import Placement, Rotation, Vector
+from freecad_to_obj.instancing import InstanceCache, get_signature
+
+
+class InstancingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.document = App.newDocument()
+
+    def add_box(self, name, placement, height=30):
+        box = self.document.addObject('Part::Box', name)
+        box.Length = 10
+        box.Width = 20
+        box.Height = height
+        box.Placement = placement
+        self.document.recompute()
+        return box
+
+    def test_instance_cache_finds_rotated_copy(self):
+        box = self.add_box('Box', Placement())
+        rotated_box = self.add_box('RotatedBox', Placement(
+            Vector(100, 0, 0), Rotation(Vector(0, 0, 1), 90)))
+        cache = InstanceCache()
+        cache.add(get_signature(box.Shape), 'tessellation')
+
+        tessellation, transform = cache.find(get_signature(rotated_box.Shape))
+
+        self.assertEqual(tessellation, 'tessellation')
+        moved_vertexes = sorted(
+            tuple(round(c, 6) for c in transform.multVec(v.Point))
+            for v in box.Shape.Vertexes)
+        rotated_vertexes = sorted(
+            tuple(round(c, 6) for c in v.Point)
+            for v in rotated_box.Shape.Vertexes)
+        self.assertEqual(moved_vertexes, rotated_vertexes)
+
+    def test_instance_cache_does_not_find_different_shape(self):
+        box = self.add_box('Box', Placement())
+        taller_box = self.add_box('TallerBox', Placement(), height=40)
+        cache = InstanceCache()
+        cache.add(get_signature(box.Shape), 'tessellation')
+
+        self.assertIsNone(cache.find(get_signature(taller_box.Shape)))
+
+    def test_export_with_instance_congruent_shapes(self):
+        boxes = [
+            self.add_box('Box', Placement()),
+            self.add_box('RotatedBox', Placement(
+                Vector(100, 0, 0), Rotation(Vector(0, 0, 1), 90)))
+        ]
+
+        expected = freecad_to_obj.export(boxes)
+        actual = freecad_to_obj.export(boxes, instance_congruent_shapes=True)
+
+        self.assertEqual(_get_vertexes(actual), _get_vertexes(expected))
+        self.assertEqual(_count_lines(actual, 'f '), _count_lines(expected, 'f '))
+        self.assertEqual(_count_lines(actual, 'o '), _count_lines(expected, 'o '))
+
+
+def _get_vertexes(obj_file_contents):
+    return sorted(
+        tuple(round(float(c), 4) + 0.0 for c in line.split()[1:])
+        for line in obj_file_contents.splitlines()
+        if line.startswith('v ')
+    )
+
+
+def _count_lines(obj_file_contents, prefix):
+    return sum(1 for line in obj_file_contents.splitlines() if line.startswith(prefix))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+
+import freecad_to_obj
+
+TRIANGLE = '\n'.join([
+    'o Triangle',
+    'v 0 0 0',
+    'v 1 0 0',
+    'v 0 1 0',
+    'vn 0 0 1',
+    'f 1//1 2//1 3//1',
+    'o TriangleWire0',
+    'v 0 0 0',
+    'v 1 0 0',
+    'l 4 5',
+    ''
+])
+
+
+class MergeTest(unittest.TestCase):
+
+    def test_merge_rebases_faces_and_lines(self):
+        merged = freecad_to_obj.merge([TRIANGLE, TRIANGLE])
+
+        lines = merged.splitlines()
+        self.assertEqual(lines[:10], TRIANGLE.splitlines())
+        self.assertEqual(lines[15], 'f 6//2 7//2 8//2')
+        self.assertEqual(lines[19], 'l 9 10')
+
+    def test_merge_keeps_relative_references(self):
+        merged = freecad_to_obj.merge([TRIANGLE, 'v 0 0 0\nv 1 0 0\nl -2 -1\n'])
+
+        self.assertEqual(merged.splitlines()[-1], 'l -2 -1')
+
+    def test_merge_without_fragments(self):
+        self.assertEqual(freecad_to_obj.merge([]), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+
+import FreeCAD as App
+import freecad_to_obj
+import Part
+from FreeCAD import Placement, Vector
+from freecad_to_obj.occlusion import get_enclosed_indices
+
+
+class OcclusionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.document = App.newDocument()
+
+    def add_housing(self):
+        outer = Part.makeBox(100, 100, 100)
+        inner = Part.makeBox(80, 80, 80, Vector(10, 10, 10))
+        housing = self.document.addObject('Part::Feature', 'Housing')
+        housing.Shape = outer.cut(inner)
+        return housing
+
+    def add_box(self, name, position, size=10):
+        box = self.document.addObject('Part::Box', name)
+        box.Length = size
+        box.Width = size
+        box.Height = size
+        box.Placement = Placement(position, App.Rotation())
+        return box
+
+    def test_get_enclosed_indices_with_component_in_cavity(self):
+        housing = self.add_housing()
+        component = self.add_box('Component', Vector(45, 45, 45))
+        self.document.recompute()
+
+        enclosed_indices = get_enclosed_indices(
+            [housing.Shape, component.Shape])
+
+        self.assertEqual(enclosed_indices, {1})
+
+    def test_get_enclosed_indices_with_component_poking_out(self):
+        housing = self.add_housing()
+        component = self.add_box('Component', Vector(45, 45, 45), size=80)
+        self.document.recompute()
+
+        enclosed_indices = get_enclosed_indices(
+            [housing.Shape, component.Shape])
+
+        self.assertEqual(enclosed_indices, set())
+
+    def test_get_enclosed_indices_with_touching_component(self):
+        housing = self.add_housing()
+        component = self.add_box('Component', Vector(10, 10, 10))
+        self.document.recompute()
+
+        enclosed_indices = get_enclosed_indices(
+            [housing.Shape, component.Shape])
+
+        self.assertEqual(enclosed_indices, set())
+
+    def test_get_enclosed_indices_with_several_housings(self):
+        housing = self.add_housing()
+        far_housing = self.add_housing()
+        far_housing.Placement = Placement(Vector(200, 0, 0), App.Rotation())
+        components = [
+            self.add_box('Component', Vector(45, 45, 45)),
+            self.add_box('Outside', Vector(120, 45, 45)),
+            self.add_box('FarComponent', Vector(245, 45, 45))
+        ]
+        self.document.recompute()
+
+        enclosed_indices = get_enclosed_indices(
+            [component.Shape for component in components] + [far_housing.Shape, housing.Shape])
+
+        self.assertEqual(enclosed_indices, {0, 2})
+
+    def test_export_with_cull_occluded(self):
+        housing = self.add_housing()
+        housing.Label = 'Housing'
+        component = self.add_box('Component', Vector(45, 45, 45))
+        component.Label = 'Component'
+        self.document.recompute()
+
+        obj_file_contents = freecad_to_obj.export(
+            [housing, component], cull_occluded=True)
+
+        lines = obj_file_contents.splitlines()
+        self.assertIn('o Housing', lines)
+        self.assertNotIn('o Component', lines)
+
+    def test_export_with_cull_occluded_and_resolved_slice(self):
+        housing = self.add_housing()
+        component = self.add_box('Component', Vector(45, 45, 45))
+        component.Label = 'Component'
+        self.document.recompute()
+
+        obj_file_contents = freecad_to_obj.export(
+            [housing, component], cull_occluded=True, resolved_slice=slice(1, None))
+
+        self.assertEqual(obj_file_contents, '')
+
+
+if __name__ == '__main__':
+    unittest.main()
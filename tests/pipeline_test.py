@@ -0,0 +1,37 @@
+import threading
+import unittest
+
+from freecad_to_obj.pipeline import iterate_in_thread
+
+
+class PipelineTest(unittest.TestCase):
+
+    def test_iterate_in_thread(self):
+        items = list(iterate_in_thread(range(100), queue_size=2))
+
+        self.assertEqual(items, list(range(100)))
+
+    def test_iterate_in_thread_raises_exceptions(self):
+        def fail():
+            yield 1
+            raise ValueError('failed')
+
+        iterator = iterate_in_thread(fail())
+
+        self.assertEqual(next(iterator), 1)
+        with self.assertRaises(ValueError) as cm:
+            next(iterator)
+        self.assertEqual(str(cm.exception), 'failed')
+
+    def test_iterate_in_thread_stops_early(self):
+        thread_count = threading.active_count()
+
+        for item in iterate_in_thread(iter(range(1000)), queue_size=1):
+            if item == 3:
+                break
+
+        self.assertEqual(threading.active_count(), thread_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
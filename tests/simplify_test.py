@@ -0,0 +1,37 @@
+import unittest
+from math import cos, pi, sin
+
+from freecad_to_obj.simplify import simplify_polyline
+
+
+class SimplifyTest(unittest.TestCase):
+
+    def test_simplify_polyline_drops_collinear_points(self):
+        points = [(0, 0, 0), (1, 0, 0), (2, 0, 0), (3, 0, 0), (3, 1, 0)]
+
+        self.assertEqual(simplify_polyline(points, 0.001), [0, 3, 4])
+
+    def test_simplify_polyline_keeps_points_beyond_tolerance(self):
+        points = [(0, 0, 0), (1, 0.5, 0), (2, 0, 0)]
+
+        self.assertEqual(simplify_polyline(points, 0.1), [0, 1, 2])
+        self.assertEqual(simplify_polyline(points, 1), [0, 2])
+
+    def test_simplify_polyline_with_closed_circle(self):
+        points = [(cos(2 * pi * i / 100), sin(2 * pi * i / 100), 0) for i in range(101)]
+
+        indices = simplify_polyline(points, 0.01)
+
+        self.assertEqual(indices[0], 0)
+        self.assertEqual(indices[-1], 100)
+        self.assertLess(len(indices), 50)
+        self.assertGreater(len(indices), 4)
+
+    def test_simplify_polyline_without_tolerance(self):
+        points = [(0, 0, 0), (1, 0, 0), (2, 0, 0)]
+
+        self.assertEqual(simplify_polyline(points, 0), [0, 1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()